@@ -5,6 +5,7 @@ Defines the shared type foundation used across the MCP server:
 - YQResult model for execution results
 - Error class hierarchy for execution failures
 - QueryBackend protocol for pluggable backend implementations
+- file_signature for caches keyed on a file's stat
 """
 
 from __future__ import annotations
@@ -12,12 +13,29 @@ from __future__ import annotations
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any, Protocol
 
+import orjson
 from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
+    import os
     from pathlib import Path
 
 
+def file_signature(stat: os.stat_result) -> tuple[int, int, int]:
+    """Return the stat fields that identify one version of a file.
+
+    The inode catches a same-size atomic replace (write, then rename over
+    the original) that lands within the same mtime tick.
+
+    Args:
+        stat: Result of a single stat call on the file
+
+    Returns:
+        Tuple of (st_mtime_ns, st_size, st_ino)
+    """
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
 class YQError(Exception):
     """Base exception for yq execution errors."""
 
@@ -55,6 +73,39 @@ class YQResult(BaseModel):
     stderr: str = Field(default="", description="Standard error from yq command")
     returncode: int = Field(default=0, description="Exit code from yq process")
     data: Any = Field(default=None, description="Parsed output data (if JSON output)")
+    stdout_bytes: bytes | None = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+        description="Raw UTF-8 stdout, when the producer kept it",
+    )
+
+    def output_bytes(self) -> bytes:
+        """Return stdout as UTF-8 bytes for writing to a file.
+
+        Reuses the raw bytes the producer already held, so writing large
+        output skips a second encode.
+
+        Returns:
+            stdout encoded as UTF-8
+        """
+        if self.stdout_bytes is not None:
+            return self.stdout_bytes
+        return self.stdout.encode("utf-8")
+
+    def json_text(self) -> str:
+        """Return the parsed data as 2-space indented JSON text.
+
+        A non-list value can only come from a single JSON document, so yq's
+        stdout already is that text and is reused as-is. Lists (which may have
+        been assembled from a JSON stream) and missing data are serialized.
+
+        Returns:
+            Indented JSON text without a trailing newline
+        """
+        if self.data is not None and not isinstance(self.data, list):
+            return self.stdout.rstrip("\n")
+        return orjson.dumps(self.data, option=orjson.OPT_INDENT_2).decode()
 
 
 class FormatType(StrEnum):
@@ -75,7 +126,7 @@ class QueryBackend(Protocol):
     def execute(
         self,
         expression: str,
-        input_data: str | None = None,
+        input_data: str | bytes | None = None,
         input_file: Path | str | None = None,
         input_format: FormatType = FormatType.YAML,
         output_format: FormatType = FormatType.JSON,
@@ -86,7 +137,7 @@ class QueryBackend(Protocol):
 
         Args:
             expression: Query expression to evaluate.
-            input_data: Input data as string (mutually exclusive with input_file).
+            input_data: Input data as string or UTF-8 bytes (mutually exclusive with input_file).
             input_file: Path to input file (mutually exclusive with input_data).
             input_format: Format of input data.
             output_format: Format for output.
@@ -114,4 +165,5 @@ __all__ = [
     "YQError",
     "YQExecutionError",
     "YQResult",
+    "file_signature",
 ]
@@ -7,6 +7,7 @@ version management, and caching. Decoupled from query execution (ARCH-03).
 from __future__ import annotations
 
 import contextlib
+import functools
 import hashlib
 import logging
 import os
@@ -20,7 +21,11 @@ from pathlib import Path
 import httpx
 import portalocker
 
-from mcp_json_yaml_toml.backends.base import YQBinaryNotFoundError, YQError
+from mcp_json_yaml_toml.backends.base import (
+    YQBinaryNotFoundError,
+    YQError,
+    file_signature,
+)
 
 # GitHub repository for yq
 GITHUB_REPO = "mikefarah/yq"
@@ -47,6 +52,11 @@ DEFAULT_YQ_CHECKSUMS: dict[str, str] = {
 
 logger = logging.getLogger(__name__)
 
+# Successful ``yq --version`` probes keyed by (path, file_signature).
+# A binary's version cannot change without the file changing, so repeat
+# lookups of an unchanged system yq skip the subprocess entirely.
+_YQ_VERSION_CACHE: dict[tuple[str, tuple[int, int, int]], str] = {}
+
 
 def get_yq_version() -> str:
     """Get the yq version to use for downloads.
@@ -74,11 +84,28 @@ def _get_storage_location() -> Path:
     1. ~/.local/bin/ (if writable) - standard user binary location
     2. Package directory binaries/ (fallback if ~/.local/bin/ not accessible)
 
+    The writability probe runs once per home directory; every yq call
+    resolves the binary through here, and the probe creates and removes a
+    file each time it runs.
+
+    Returns:
+        Path to storage directory (created if it doesn't exist and writable)
+    """
+    return _storage_location_for(Path.home())
+
+
+@functools.lru_cache(maxsize=4)
+def _storage_location_for(home: Path) -> Path:
+    """Probe and return the yq storage directory for one home directory.
+
+    Args:
+        home: User home directory
+
     Returns:
         Path to storage directory (created if it doesn't exist and writable)
     """
     # Try primary location: ~/.local/bin/
-    local_bin = Path.home() / ".local" / "bin"
+    local_bin = home / ".local" / "bin"
     try:
         local_bin.mkdir(parents=True, exist_ok=True)
         # Test if writable
@@ -343,6 +370,33 @@ def _download_yq_binary(
 def _get_yq_version_string(yq_path: Path) -> str | None:
     """Get the version string from a yq binary.
 
+    Successful probes are cached per file identity (path, mtime, size), so
+    only the first lookup of a given binary runs ``yq --version``.
+
+    Args:
+        yq_path: Path to the yq binary
+
+    Returns:
+        Version string (e.g., "v4.52.2") if mikefarah/yq, None otherwise
+    """
+    try:
+        stat = yq_path.stat()
+    except OSError:
+        return _probe_yq_version_string(yq_path)
+
+    key = (str(yq_path), file_signature(stat))
+    cached = _YQ_VERSION_CACHE.get(key)
+    if cached is not None:
+        return cached
+    version = _probe_yq_version_string(yq_path)
+    if version is not None:
+        _YQ_VERSION_CACHE[key] = version
+    return version
+
+
+def _probe_yq_version_string(yq_path: Path) -> str | None:
+    """Run ``yq --version`` and extract the mikefarah/yq version string.
+
     Args:
         yq_path: Path to the yq binary
 
@@ -647,6 +701,7 @@ __all__ = [
     "DEFAULT_YQ_CHECKSUMS",
     "DEFAULT_YQ_VERSION",
     "GITHUB_REPO",
+    "_YQ_VERSION_CACHE",
     "_cleanup_old_versions",
     "_download_file",
     "_download_yq_binary",
@@ -659,6 +714,7 @@ __all__ = [
     "_get_yq_version_string",
     "_is_mikefarah_yq",
     "_parse_version",
+    "_storage_location_for",
     "_verify_checksum",
     "_version_meets_minimum",
     "get_yq_binary_path",
@@ -0,0 +1,185 @@
+"""In-process evaluation of simple yq path expressions on JSON data.
+
+Opt-in fast path for execute_yq (``MCP_JYT_YQ_BACKEND=inprocess``). Plain
+path lookups such as ``.``, ``.name`` or ``.users[0].email`` on JSON input
+with JSON output are answered with orjson, no yq subprocess needed.
+Anything else returns None so the caller falls back to yq.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from mcp_json_yaml_toml.backends.base import FormatType, YQResult, file_signature
+
+# Identity, or a chain of ``.key`` segments each optionally indexed by ``[n]``
+_SIMPLE_PATH_RE = re.compile(r"\.|(?:\.[A-Za-z_]\w*(?:\[\d+\])*)+")
+_PATH_TOKEN_RE = re.compile(r"\.([A-Za-z_]\w*)|\[(\d+)\]")
+
+_OUTPUT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+
+# JSON files at least this large are parsed from a read-only memory map, so
+# their bytes stay in the page cache instead of a second copy on the heap
+_MMAP_THRESHOLD = 1 << 20
+
+# Identity results for JSON files, keyed by (path, file_signature). Sync tools
+# run on worker threads, so lookups and evictions hold the lock; parses do not.
+_IDENTITY_CACHE: OrderedDict[tuple[str, tuple[int, int, int]], YQResult] = OrderedDict()
+_IDENTITY_CACHE_LOCK = threading.Lock()
+_IDENTITY_CACHE_MAXSIZE = 64
+# A file rewritten within one timestamp tick keeps its mtime, so only files
+# older than this are cached
+_IDENTITY_CACHE_MIN_AGE_NS = 2_000_000_000
+
+
+def inprocess_enabled() -> bool:
+    """Return True when ``MCP_JYT_YQ_BACKEND`` selects the in-process path."""
+    return os.environ.get("MCP_JYT_YQ_BACKEND", "").strip().lower() == "inprocess"
+
+
+def _select_path(data: Any, expression: str) -> tuple[bool, Any]:
+    """Walk a simple path expression through parsed JSON.
+
+    Missing keys, out-of-range indexes, and lookups on null yield null, as
+    in yq. Indexing into a value of the wrong type is left for yq to report.
+
+    Returns:
+        (handled, value), where handled is False if yq must evaluate instead
+    """
+    node = data
+    for key, index in _PATH_TOKEN_RE.findall(expression):
+        if node is None:
+            continue
+        if key:
+            if not isinstance(node, dict):
+                return False, None
+            node = node.get(key)
+        else:
+            if not isinstance(node, list):
+                return False, None
+            position = int(index)
+            node = node[position] if position < len(node) else None
+    return True, node
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse a JSON file, mapping it into memory when it is large.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+        orjson.JSONDecodeError: If the content is not a single JSON value
+    """
+    # Unbuffered: readall() sizes one read from fstat, and a BufferedReader
+    # would only add a layer (and its 8 KiB buffer) in front of it
+    with path.open("rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            return orjson.loads(f.readall())
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            return orjson.loads(view)
+
+
+def evaluate_simple_path(
+    expression: str,
+    input_data: str | bytes | None,
+    input_file: Path | str | None,
+    input_format: FormatType,
+    output_format: FormatType,
+) -> YQResult | None:
+    """Evaluate a simple path expression without spawning yq.
+
+    Args:
+        expression: yq expression to evaluate
+        input_data: Input data as string or UTF-8 bytes (mutually exclusive with input_file)
+        input_file: Path to input file (mutually exclusive with input_data)
+        input_format: Format of input data
+        output_format: Format for output
+
+    Returns:
+        YQResult matching yq's JSON output, or None when yq must handle the call
+    """
+    if (
+        input_format != FormatType.JSON
+        or output_format != FormatType.JSON
+        or _SIMPLE_PATH_RE.fullmatch(expression) is None
+    ):
+        return None
+
+    try:
+        data = (
+            _load_json_file(Path(input_file))
+            if input_file is not None
+            else orjson.loads(input_data or b"")
+        )
+    except (OSError, orjson.JSONDecodeError):
+        # Unreadable input, JSON streams and big integers are left to yq
+        return None
+
+    handled, value = _select_path(data, expression)
+    if not handled:
+        return None
+    output = orjson.dumps(value, option=_OUTPUT_OPTIONS)
+    return YQResult(
+        stdout=output.decode(), stderr="", returncode=0, data=value, stdout_bytes=output
+    )
+
+
+def evaluate_identity(input_file: Path) -> YQResult | None:
+    """Answer ``.`` on a JSON file with JSON output, reusing earlier parses.
+
+    Used by data_query regardless of ``MCP_JYT_YQ_BACKEND``: the identity of
+    a JSON document is the parsed document itself, so there is nothing for
+    yq to decide. Results stay cached while the file's stat signature is
+    unchanged and share their parsed data, which callers must not mutate.
+
+    Args:
+        input_file: Path to a JSON file
+
+    Returns:
+        YQResult matching yq's JSON output, or None when yq must handle the file
+    """
+    try:
+        stat = input_file.stat()
+    except OSError:
+        return None
+    key = (str(input_file), file_signature(stat))
+    with _IDENTITY_CACHE_LOCK:
+        cached = _IDENTITY_CACHE.get(key)
+        if cached is not None:
+            _IDENTITY_CACHE.move_to_end(key)
+    if cached is not None:
+        return cached
+
+    result = evaluate_simple_path(
+        ".", None, input_file, FormatType.JSON, FormatType.JSON
+    )
+    if (
+        result is not None
+        and time.time_ns() - stat.st_mtime_ns >= _IDENTITY_CACHE_MIN_AGE_NS
+    ):
+        with _IDENTITY_CACHE_LOCK:
+            _IDENTITY_CACHE[key] = result
+            _IDENTITY_CACHE.move_to_end(key)
+            if len(_IDENTITY_CACHE) > _IDENTITY_CACHE_MAXSIZE:
+                _IDENTITY_CACHE.popitem(last=False)
+    return result
+
+
+__all__ = [
+    "_IDENTITY_CACHE",
+    "evaluate_identity",
+    "evaluate_simple_path",
+    "inprocess_enabled",
+]
@@ -6,20 +6,55 @@ for subprocess-based query execution against YAML/JSON/TOML/XML data.
 
 from __future__ import annotations
 
+import functools
+import re
 import subprocess
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import orjson
 
-from mcp_json_yaml_toml.backends.base import FormatType, YQExecutionError, YQResult
+from mcp_json_yaml_toml.backends.base import (
+    FormatType,
+    YQExecutionError,
+    YQResult,
+    file_signature,
+)
 from mcp_json_yaml_toml.backends.binary_manager import (
     get_yq_binary_path,
     validate_yq_binary,
 )
-from mcp_json_yaml_toml.telemetry import get_tracer
+from mcp_json_yaml_toml.backends.inprocess import (
+    evaluate_simple_path,
+    inprocess_enabled,
+)
+from mcp_json_yaml_toml.telemetry import get_tracer, is_tracing_enabled
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from opentelemetry.trace import Span
+
+# Successful read-only file queries keyed by (expression, path, file_signature,
+# input_format, output_format). Editing or replacing the file changes its
+# signature, so a stale result is never served; the least recently used entry
+# is evicted once the cache holds _RESULT_CACHE_MAXSIZE results. Entries are
+# stored without parsed data (see _cached_result) and guarded by a lock, as
+# the server may run tool calls on worker threads.
+_RESULT_CACHE: OrderedDict[
+    tuple[str, str, tuple[int, int, int], str, str], YQResult
+] = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+_RESULT_CACHE_MAXSIZE = 1024
+
+# Files modified this recently are not cached: filesystem timestamps are
+# coarse, so a same-size rewrite within one tick could keep the same mtime.
+_RESULT_CACHE_MIN_AGE_NS = 2_000_000_000
+
+# Expressions reading other files, the environment, or the clock depend on
+# more than the input file's identity, so their results are not cached
+_UNCACHEABLE_EXPRESSION_RE = re.compile(r"\b(?:load\w*|(?:str)?env|envsubst|now)\b")
 
 
 def parse_yq_error(stderr: str) -> str:
@@ -58,7 +93,7 @@ def parse_yq_error(stderr: str) -> str:
 
 
 def _validate_execute_args(
-    input_data: str | None,
+    input_data: str | bytes | None,
     input_file: Path | str | None,
     in_place: bool,
     null_input: bool,
@@ -66,7 +101,7 @@ def _validate_execute_args(
     """Validate arguments for execute_yq.
 
     Args:
-        input_data: Input data as string
+        input_data: Input data as string or UTF-8 bytes
         input_file: Path to input file
         in_place: Whether to modify file in place
         null_input: Whether to use null input
@@ -84,46 +119,76 @@ def _validate_execute_args(
         raise ValueError("null_input cannot be used with input_data or input_file")
 
 
-def _build_yq_command(
-    binary_path: Path,
-    expression: str,
-    input_file: Path | str | None,
+@functools.lru_cache(maxsize=64)
+def _yq_argv_prefix(
+    binary_path: str,
     input_format: FormatType,
     output_format: FormatType,
     in_place: bool,
     null_input: bool,
-) -> list[str]:
-    """Build yq command arguments.
+) -> tuple[str, ...]:
+    """Build the yq arguments that precede the expression.
+
+    Only a handful of binary and format combinations occur in practice, so
+    each prefix is assembled once and reused by every later call.
 
     Args:
         binary_path: Path to yq binary
-        expression: yq expression to evaluate
-        input_file: Path to input file (if any)
         input_format: Format of input data
         output_format: Format for output
         in_place: Modify file in place
         null_input: Don't read input
 
     Returns:
-        List of command arguments
+        Tuple of leading command arguments
     """
-    cmd: list[str] = [str(binary_path)]
+    prefix: list[str] = [binary_path]
 
     # Add format flags
     if not null_input:
-        cmd.extend(["-p", input_format])
-    cmd.extend(["-o", output_format])
+        prefix.extend(["-p", input_format])
+    prefix.extend(["-o", output_format])
 
     # Add in-place flag if requested
     if in_place:
-        cmd.append("-i")
+        prefix.append("-i")
 
     # Add null-input flag if requested
     if null_input:  # pragma: no cover
-        cmd.append("-n")
+        prefix.append("-n")
+
+    return tuple(prefix)
+
+
+def _build_yq_command(
+    binary_path: Path,
+    expression: str,
+    input_file: Path | str | None,
+    input_format: FormatType,
+    output_format: FormatType,
+    in_place: bool,
+    null_input: bool,
+) -> list[str]:
+    """Build yq command arguments.
 
-    # Add expression
-    cmd.append(expression)
+    Args:
+        binary_path: Path to yq binary
+        expression: yq expression to evaluate
+        input_file: Path to input file (if any)
+        input_format: Format of input data
+        output_format: Format for output
+        in_place: Modify file in place
+        null_input: Don't read input
+
+    Returns:
+        List of command arguments
+    """
+    cmd = [
+        *_yq_argv_prefix(
+            str(binary_path), input_format, output_format, in_place, null_input
+        ),
+        expression,
+    ]
 
     # Add input file if specified
     if input_file is not None:
@@ -133,13 +198,13 @@ def _build_yq_command(
 
 
 def _run_yq_subprocess(
-    cmd: list[str], input_data: str | None
+    cmd: list[str], input_data: str | bytes | None
 ) -> subprocess.CompletedProcess[bytes]:
     """Run yq subprocess with error handling.
 
     Args:
         cmd: Command arguments
-        input_data: Input data as string (if any)
+        input_data: Input data as string or UTF-8 bytes (if any)
 
     Returns:
         Completed subprocess result
@@ -147,10 +212,13 @@ def _run_yq_subprocess(
     Raises:
         YQExecutionError: If execution fails
     """
+    # Bytes go to stdin as-is, skipping a decode/encode round trip
+    if isinstance(input_data, str):
+        input_data = input_data.encode("utf-8")
     try:
         return subprocess.run(
             cmd,
-            input=input_data.encode("utf-8") if input_data else None,
+            input=input_data or None,
             capture_output=True,
             check=False,  # We'll handle errors ourselves
             timeout=30,  # 30 second timeout
@@ -166,12 +234,16 @@ def _run_yq_subprocess(
 
 
 def _parse_json_output(
-    stdout: str, stderr: str, output_format: FormatType
+    stdout: str | bytes, stderr: str, output_format: FormatType
 ) -> tuple[Any, str]:
     """Parse JSON output from yq.
 
+    orjson parses the raw subprocess bytes directly, so the output is never
+    re-encoded from the decoded ``str``, and the whitespace-only check scans
+    in place rather than building a stripped copy.
+
     Args:
-        stdout: Standard output from yq
+        stdout: Standard output from yq, raw or decoded
         stderr: Standard error from yq
         output_format: Expected output format
 
@@ -179,7 +251,7 @@ def _parse_json_output(
         Tuple of (parsed_data, updated_stderr)
     """
     parsed_data: Any = None
-    if output_format == "json" and stdout.strip():
+    if output_format == "json" and stdout and not stdout.isspace():
         try:
             parsed_data = orjson.loads(stdout)
         except orjson.JSONDecodeError as e:
@@ -202,7 +274,7 @@ def _parse_json_output(
 
 def execute_yq(
     expression: str,
-    input_data: str | None = None,
+    input_data: str | bytes | None = None,
     input_file: Path | str | None = None,
     input_format: FormatType = FormatType.YAML,
     output_format: FormatType = FormatType.JSON,
@@ -213,7 +285,7 @@ def execute_yq(
 
     Args:
         expression: yq expression to evaluate (e.g., '.name', '.items[]')
-        input_data: Input data as string (mutually exclusive with input_file)
+        input_data: Input data as string or UTF-8 bytes (mutually exclusive with input_file)
         input_file: Path to input file (mutually exclusive with input_data)
         input_format: Format of input data (default: yaml)
         output_format: Format for output (default: json)
@@ -231,6 +303,123 @@ def execute_yq(
     # Validate arguments
     _validate_execute_args(input_data, input_file, in_place, null_input)
 
+    # Serve repeat read-only queries on an unchanged file from the cache
+    cache_key = (
+        _result_cache_key(expression, input_file, input_format, output_format)
+        if input_file is not None
+        and not in_place
+        and _UNCACHEABLE_EXPRESSION_RE.search(expression) is None
+        else None
+    )
+    if cache_key is not None:
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                _RESULT_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            return _cached_result(cached, output_format)
+
+    result = _evaluate(
+        expression,
+        input_data,
+        input_file,
+        input_format,
+        output_format,
+        in_place,
+        null_input,
+    )
+    if cache_key is not None:
+        # Strings and bytes are immutable, so only the parsed data is dropped
+        entry = result.model_copy(update={"data": None})
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[cache_key] = entry
+            _RESULT_CACHE.move_to_end(cache_key)
+            if len(_RESULT_CACHE) > _RESULT_CACHE_MAXSIZE:
+                _RESULT_CACHE.popitem(last=False)
+    return result
+
+
+def _cached_result(cached: YQResult, output_format: FormatType) -> YQResult:
+    """Build a caller-owned result from a result cache entry.
+
+    Entries keep the raw output but not its parsed data, so parsing it again
+    gives each caller data it may mutate freely, at less cost than a deep copy.
+
+    Args:
+        cached: Result cache entry
+        output_format: Format of the cached output
+
+    Returns:
+        Result equal to the one originally evaluated
+    """
+    data, _ = _parse_json_output(cached.output_bytes(), cached.stderr, output_format)
+    return cached.model_copy(update={"data": data})
+
+
+def _result_cache_key(
+    expression: str,
+    input_file: Path | str,
+    input_format: FormatType,
+    output_format: FormatType,
+) -> tuple[str, str, tuple[int, int, int], str, str] | None:
+    """Build the result cache key for a read-only query on a file.
+
+    Args:
+        expression: yq expression to evaluate
+        input_file: Path to input file
+        input_format: Format of input data
+        output_format: Format for output
+
+    Returns:
+        Cache key, or None if the file cannot be stat-ed or was modified too
+        recently for its timestamp to identify its content
+    """
+    try:
+        stat = Path(input_file).stat()
+    except OSError:
+        return None
+    if time.time_ns() - stat.st_mtime_ns < _RESULT_CACHE_MIN_AGE_NS:
+        return None
+    return (
+        expression,
+        str(input_file),
+        file_signature(stat),
+        str(input_format),
+        str(output_format),
+    )
+
+
+def _evaluate(
+    expression: str,
+    input_data: str | bytes | None,
+    input_file: Path | str | None,
+    input_format: FormatType,
+    output_format: FormatType,
+    in_place: bool,
+    null_input: bool,
+) -> YQResult:
+    """Evaluate a validated yq call in-process or through the yq binary.
+
+    Args:
+        expression: yq expression to evaluate
+        input_data: Input data as string or UTF-8 bytes (mutually exclusive with input_file)
+        input_file: Path to input file (mutually exclusive with input_data)
+        input_format: Format of input data
+        output_format: Format for output
+        in_place: Modify file in place (only valid with input_file)
+        null_input: Don't read input
+
+    Returns:
+        YQResult object with stdout, stderr, returncode, and parsed data
+    """
+    # Opt-in: answer simple JSON path lookups without a yq subprocess
+    if not (in_place or null_input) and inprocess_enabled():
+        result = evaluate_simple_path(
+            expression, input_data, input_file, input_format, output_format
+        )
+        if result is not None:
+            return result
+
     # Get binary path
     binary_path = get_yq_binary_path()
 
@@ -245,34 +434,65 @@ def execute_yq(
         null_input,
     )
 
-    # Execute command with telemetry span
+    # Execute command, inside a telemetry span only when spans are recorded
     tracer = get_tracer()
+    if not is_tracing_enabled(tracer):
+        return _execute_command(cmd, input_data, output_format)
     with tracer.start_as_current_span("yq.execute") as span:
-        span.set_attribute("yq.expression", expression)
-        span.set_attribute("yq.input_format", str(input_format))
-        span.set_attribute("yq.output_format", str(output_format))
+        span.set_attributes({
+            "yq.expression": expression,
+            "yq.input_format": str(input_format),
+            "yq.output_format": str(output_format),
+        })
+        return _execute_command(cmd, input_data, output_format, span)
 
-        result = _run_yq_subprocess(cmd, input_data)
 
-        # Decode output
-        stdout = result.stdout.decode("utf-8")
-        stderr = result.stderr.decode("utf-8")
+def _execute_command(
+    cmd: list[str],
+    input_data: str | bytes | None,
+    output_format: FormatType,
+    span: Span | None = None,
+) -> YQResult:
+    """Run a built yq command and decode, check, and parse its output.
+
+    Args:
+        cmd: Command list from _build_yq_command
+        input_data: Optional stdin data
+        output_format: Expected output format
+        span: Active telemetry span to record the return code on, if any
+
+    Returns:
+        YQResult object with stdout, stderr, returncode, and parsed data
+
+    Raises:
+        YQExecutionError: If yq exits with a non-zero status
+    """
+    result = _run_yq_subprocess(cmd, input_data)
+
+    # Decode output
+    stdout = result.stdout.decode("utf-8")
+    stderr = result.stderr.decode("utf-8")
+    if span is not None:
         span.set_attribute("yq.returncode", result.returncode)
 
-        # Check for errors
-        if result.returncode != 0:
-            error_msg = parse_yq_error(stderr)
-            raise YQExecutionError(
-                f"yq command failed: {error_msg}",
-                stderr=stderr,
-                returncode=result.returncode,
-            )
+    # Check for errors
+    if result.returncode != 0:
+        error_msg = parse_yq_error(stderr)
+        raise YQExecutionError(
+            f"yq command failed: {error_msg}",
+            stderr=stderr,
+            returncode=result.returncode,
+        )
 
-        # Parse JSON output if applicable
-        parsed_data, stderr = _parse_json_output(stdout, stderr, output_format)
+    # Parse JSON output if applicable
+    parsed_data, stderr = _parse_json_output(result.stdout, stderr, output_format)
 
     return YQResult(
-        stdout=stdout, stderr=stderr, returncode=result.returncode, data=parsed_data
+        stdout=stdout,
+        stderr=stderr,
+        returncode=result.returncode,
+        data=parsed_data,
+        stdout_bytes=result.stdout,
     )
 
 
@@ -282,7 +502,7 @@ class YqBackend:
     def execute(
         self,
         expression: str,
-        input_data: str | None = None,
+        input_data: str | bytes | None = None,
         input_file: Path | str | None = None,
         input_format: FormatType = FormatType.YAML,
         output_format: FormatType = FormatType.JSON,
@@ -293,7 +513,7 @@ class YqBackend:
 
         Args:
             expression: yq expression to evaluate.
-            input_data: Input data as string (mutually exclusive with input_file).
+            input_data: Input data as string or UTF-8 bytes (mutually exclusive with input_file).
             input_file: Path to input file (mutually exclusive with input_data).
             input_format: Format of input data.
             output_format: Format for output.
@@ -323,6 +543,7 @@ class YqBackend:
 
 
 __all__ = [
+    "_RESULT_CACHE",
     "YqBackend",
     "_build_yq_command",
     "_parse_json_output",
@@ -0,0 +1,43 @@
+"""Process-wide caches kept by the package.
+
+Every module-level cache is cleared through ``clear_caches``, so callers that
+need a cold start (test isolation, a long-running host that swapped its yq
+binary or home directory) do not reach into each module's private state.
+Per-instance memos, such as a ``SchemaManager``'s catalog, live and die with
+their instance.
+"""
+
+from __future__ import annotations
+
+from mcp_json_yaml_toml.backends.binary_manager import (
+    _YQ_VERSION_CACHE,
+    _storage_location_for,
+)
+from mcp_json_yaml_toml.backends.inprocess import _IDENTITY_CACHE, _IDENTITY_CACHE_LOCK
+from mcp_json_yaml_toml.backends.yq import (
+    _RESULT_CACHE,
+    _RESULT_CACHE_LOCK,
+    _yq_argv_prefix,
+)
+from mcp_json_yaml_toml.config import parse_enabled_formats
+from mcp_json_yaml_toml.formats.base import _count_yaml_documents, _format_for_suffix
+from mcp_json_yaml_toml.services.schema_validation import _schema_validator
+from mcp_json_yaml_toml.toml_utils import _split_key_path
+
+__all__ = ["clear_caches"]
+
+
+def clear_caches() -> None:
+    """Clear every module-level cache in the package."""
+    parse_enabled_formats.cache_clear()
+    _YQ_VERSION_CACHE.clear()
+    _storage_location_for.cache_clear()
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE.clear()
+    _yq_argv_prefix.cache_clear()
+    with _IDENTITY_CACHE_LOCK:
+        _IDENTITY_CACHE.clear()
+    _count_yaml_documents.cache_clear()
+    _format_for_suffix.cache_clear()
+    _split_key_path.cache_clear()
+    _schema_validator.cache_clear()
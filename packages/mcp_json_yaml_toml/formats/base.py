@@ -6,16 +6,24 @@ Extracted from server.py to complete ARCH-02.
 
 from __future__ import annotations
 
+import functools
+import os
+import stat
+import time
+import tomllib
 from collections import UserList
 from pathlib import Path
 from typing import Any, Literal
 
 import orjson
-import tomlkit
 from fastmcp.exceptions import ToolError
 from ruamel.yaml import YAML
 
-from mcp_json_yaml_toml.backends.base import FormatType, YQExecutionError
+from mcp_json_yaml_toml.backends.base import (
+    FormatType,
+    YQExecutionError,
+    file_signature,
+)
 
 
 class MultiDocumentYaml(UserList[Any]):
@@ -28,34 +36,96 @@ def _load_yaml_documents(content: str) -> list[Any]:
     return list(yaml.load_all(content))
 
 
-def _detect_file_format(file_path: str | Path) -> FormatType:
-    """Detect format from file extension.
+def _read_file_bytes(path: str | Path, size: int | None = None) -> bytes:
+    """Read a whole file with raw ``os.read`` calls.
+
+    Skips the buffered/text I/O layers of ``Path.read_text`` for one-shot
+    reads of small config files; callers decode once or hand the bytes to a
+    parser directly.
 
     Args:
-        file_path: Path to file
+        path: File to read.
+        size: File size from an earlier stat, if the caller already has one.
 
     Returns:
-        Detected format type
+        The file content.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if size is None:
+            size = os.fstat(fd).st_size
+        # One byte past the expected size shows whether the file has grown
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+        chunks = [data]
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+# Files modified this recently have their documents counted afresh: filesystem
+# timestamps are coarse, so a same-size rewrite within one tick could keep the
+# same signature.
+_DOCUMENT_COUNT_MIN_AGE_NS = 2_000_000_000
+
+
+def _read_yaml_document_count(path: str, size: int) -> int:
+    """Count YAML documents in a file by parsing it."""
+    return len(_load_yaml_documents(_read_file_bytes(path, size).decode("utf-8")))
+
+
+@functools.lru_cache(maxsize=128)
+def _count_yaml_documents(path: str, signature: tuple[int, int, int]) -> int:
+    """Count YAML documents in a file, cached per (path, file_signature).
+
+    The signature is part of the cache key, so a rewritten file gets a new
+    key and is parsed again while unchanged files skip the parse. Its size
+    field sizes the read.
+    """
+    _, size, _ = signature
+    return _read_yaml_document_count(path, size)
+
+
+@functools.lru_cache(maxsize=64)
+def _format_for_suffix(suffix: str) -> FormatType:
+    """Map a file extension to its format, cached per distinct extension.
 
     Raises:
-        ToolError: If format cannot be detected
+        ToolError: If the extension names no supported format
     """
-    path = Path(file_path)
-    suffix = path.suffix.lower().lstrip(".")
+    fmt = suffix.lower().lstrip(".")
     # Handle yml -> yaml alias
-    if suffix == "yml":
-        suffix = "yaml"
+    if fmt == "yml":
+        fmt = "yaml"
 
     try:
-        return FormatType(suffix)
+        return FormatType(fmt)
     except ValueError:
         valid_formats = [f.value for f in FormatType]
         raise ToolError(
-            f"Cannot detect format from extension '.{suffix}'. "
+            f"Cannot detect format from extension '.{fmt}'. "
             f"Supported formats: {', '.join(valid_formats)}"
         ) from None
 
 
+def _detect_file_format(file_path: str | Path) -> FormatType:
+    """Detect format from file extension.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Detected format type
+
+    Raises:
+        ToolError: If format cannot be detected
+    """
+    return _format_for_suffix(Path(file_path).suffix)
+
+
 def _parse_content_for_validation(
     content: str, input_format: FormatType | str
 ) -> Any | None:
@@ -97,7 +167,9 @@ def _parse_content_for_validation(
                         else MultiDocumentYaml(documents)
                     )
             case FormatType.TOML:
-                parsed_data = tomlkit.parse(content)
+                # Plain data is all validation needs; tomllib skips tomlkit's
+                # comment- and layout-preserving document tree
+                parsed_data = tomllib.loads(content)
             case _:
                 parsed_data = None
     except Exception as e:
@@ -181,9 +253,38 @@ def resolve_file_path(file_path: str, *, must_exist: bool = True) -> Path:
     Raises:
         ToolError: If must_exist is True and file does not exist.
     """
-    path = Path(file_path).expanduser().resolve()
-    if must_exist and not path.exists():
-        raise ToolError(f"File not found: {file_path}")
+    path = Path(file_path).expanduser()
+    if not must_exist:
+        return path.resolve()
+    # Strict resolution fails on a missing file itself, so no exists() stat
+    try:
+        return path.resolve(strict=True)
+    except (FileNotFoundError, NotADirectoryError):
+        raise ToolError(f"File not found: {file_path}") from None
+
+
+def resolve_input_file(file_path: str) -> Path:
+    """Resolve a path that must name an existing regular file.
+
+    Existence is checked by strict resolution and file type by a single stat
+    call, instead of separate ``exists()`` / ``is_file()`` probes.
+
+    Args:
+        file_path: Raw file path string from tool input.
+
+    Returns:
+        Resolved absolute Path.
+
+    Raises:
+        ToolError: If the file does not exist or is not a regular file.
+    """
+    try:
+        path = Path(file_path).expanduser().resolve(strict=True)
+        mode = path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        raise ToolError(f"File not found: {file_path}") from None
+    if not stat.S_ISREG(mode):
+        raise ToolError(f"Not a regular file: {file_path}")
     return path
 
 
@@ -235,8 +336,11 @@ def validate_document_index_for_file(
 
     if input_format != FormatType.YAML:
         raise ToolError("document_index is only supported for YAML input files")
-    path = Path(file_path)
-    document_count = len(_load_yaml_documents(path.read_text(encoding="utf-8")))
+    st = Path(file_path).stat()
+    if time.time_ns() - st.st_mtime_ns < _DOCUMENT_COUNT_MIN_AGE_NS:
+        document_count = _read_yaml_document_count(str(file_path), st.st_size)
+    else:
+        document_count = _count_yaml_documents(str(file_path), file_signature(st))
     if validated_index >= document_count:
         raise ToolError(
             f"Document index {validated_index} out of range (found {document_count} documents)"
@@ -268,7 +372,9 @@ __all__ = [
     "_parse_content_for_validation",
     "_parse_set_value",
     "_parse_typed_json",
+    "_read_file_bytes",
     "resolve_file_path",
+    "resolve_input_file",
     "should_fallback_toml_to_json",
     "validate_document_index_for_file",
     "wrap_expression_for_document",
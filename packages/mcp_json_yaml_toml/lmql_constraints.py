@@ -117,6 +117,14 @@ class RegexConstraint(Constraint):
 
     PATTERN: ClassVar[str] = ""
 
+    # LMQL Regex for PATTERN, compiled once when each subclass is created
+    _REGEX: ClassVar[Regex | None] = None
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Compile the subclass PATTERN once at class creation time."""
+        super().__init_subclass__(**kwargs)
+        cls._REGEX = Regex(cls.PATTERN) if cls.PATTERN else None
+
     @classmethod
     def empty_error(cls) -> str:
         """Provide the default error message for an empty input.
@@ -165,7 +173,7 @@ class RegexConstraint(Constraint):
                 remaining_pattern=cls.PATTERN,
             )
 
-        regex = Regex(cls.PATTERN)
+        regex = cls._REGEX if cls._REGEX is not None else Regex(cls.PATTERN)
 
         # Full match - valid
         if regex.fullmatch(value):
@@ -271,6 +279,13 @@ class ConstraintRegistry:
 
     _constraints: ClassVar[dict[str, type[Constraint]]] = {}
 
+    # Bound validate methods keyed by name, so validate() is one dict lookup
+    _validators: ClassVar[dict[str, Callable[[str], ValidationResult]]] = {}
+
+    # Definitions built on first request; reset whenever a constraint registers
+    _definitions: ClassVar[dict[str, dict[str, str | bool | list[str]]] | None] = None
+    _definition_list: ClassVar[list[dict[str, str | bool | list[str]]] | None] = None
+
     @classmethod
     def register(cls, name: str) -> Callable[[type[Constraint]], type[Constraint]]:
         """Register a constraint class under a given unique name in the registry.
@@ -293,6 +308,9 @@ class ConstraintRegistry:
             """
             constraint_cls.name = name
             cls._constraints[name] = constraint_cls
+            cls._validators[name] = constraint_cls.validate
+            cls._definitions = None
+            cls._definition_list = None
             return constraint_cls
 
         return decorator
@@ -316,10 +334,10 @@ class ConstraintRegistry:
         Returns:
             ValidationResult: outcome of validating `value` against the named constraint. If the named constraint is not found, `valid` is `False` and `error` describes the unknown constraint.
         """
-        constraint = cls.get(name)
-        if not constraint:
+        validator = cls._validators.get(name)
+        if validator is None:
             return ValidationResult(valid=False, error=f"Unknown constraint: {name}")
-        return constraint.validate(value)
+        return validator(value)
 
     @classmethod
     def list_constraints(cls) -> list[str]:
@@ -334,10 +352,35 @@ class ConstraintRegistry:
     def get_all_definitions(cls) -> dict[str, dict[str, str | bool | list[str]]]:
         """Collect client-facing definitions for every registered constraint.
 
+        Definitions are static metadata, so the mapping is built once and shared
+        until another constraint is registered. Callers must not mutate it.
+
         Returns:
             definitions (dict[str, dict[str, str | bool | list[str]]]): Mapping from constraint name to its exported definition (e.g., name, description, lmql_syntax, pattern, allowed_values, and supports_partial).
         """
-        return {name: c.get_definition() for name, c in cls._constraints.items()}
+        if cls._definitions is None:
+            cls._definitions = {
+                name: c.get_definition() for name, c in cls._constraints.items()
+            }
+        return cls._definitions
+
+    @classmethod
+    def get_definition_list(cls) -> list[dict[str, str | bool | list[str]]]:
+        """Return every registered constraint definition as a list.
+
+        Each entry carries its own "name" key. Like get_all_definitions, the
+        list is built once and shared until another constraint is registered.
+        Callers must not mutate it.
+
+        Returns:
+            list[dict[str, str | bool | list[str]]]: Definitions in registration order.
+        """
+        if cls._definition_list is None:
+            cls._definition_list = [
+                {"name": name, **defn}
+                for name, defn in cls.get_all_definitions().items()
+            ]
+        return cls._definition_list
 
 
 # =============================================================================
@@ -515,7 +558,8 @@ class IntConstraint(Constraint):
         if has_minus and not check_value:
             return ValidationResult(valid=False, is_partial=True, error=None)
 
-        if check_value and all(c in string.digits for c in check_value):
+        # str.isdigit also accepts non-ASCII digits; restrict to 0-9 like string.digits
+        if check_value.isascii() and check_value.isdigit():
             return ValidationResult(valid=True)
 
         # Find first non-digit
@@ -715,12 +759,9 @@ class FilePathConstraint(Constraint):
                 valid=False, error="Null bytes not allowed in paths"
             )
 
-        # Basic structure check
-        regex = Regex(cls.PATTERN)
-        if regex.fullmatch(value):
-            return ValidationResult(valid=True)
-
-        return ValidationResult(valid=True)  # Be permissive for complex paths
+        # PATTERN only documents the common shape; complex paths are accepted too,
+        # so no regex match is needed to reach the verdict
+        return ValidationResult(valid=True)
 
     @classmethod
     def get_definition(cls) -> dict[str, str | bool | list[str]]:
@@ -32,8 +32,9 @@ class _DictAccessMixin:
 
     def _resolve_field_name(self, key: str) -> str:
         """Resolve an alias to its field name, or return key unchanged."""
-        # Fast path: key is a direct model field
-        fields: dict[str, Any] = getattr(self, "model_fields", {})
+        # Fast path: key is a direct model field. Read from the class:
+        # instance access is deprecated and warns on every call.
+        fields: dict[str, Any] = getattr(type(self), "model_fields", {})
         if key in fields:
             return key
         # Check aliases
@@ -4,13 +4,12 @@ from __future__ import annotations
 
 import fnmatch
 import re
+import tomllib
 from pathlib import Path  # noqa: TC003 — used at runtime in function bodies
 
 import orjson
-import tomlkit
 from ruamel.yaml import YAML
 from ruamel.yaml.error import YAMLError
-from tomlkit.exceptions import ParseError, TOMLKitError
 
 # Regex to strip C-style comments (/* ... */) and C++-style comments (// ...)
 _COMMENT_RE = re.compile(r"//.*?$|/\*.*?\*/", re.DOTALL | re.MULTILINE)
@@ -79,9 +78,9 @@ def _extract_from_toml(content: str) -> str | None:
 
     # Check for top-level $schema key
     try:
-        data = tomlkit.parse(content)
+        data = tomllib.loads(content)
         return data.get("$schema")
-    except (ParseError, TOMLKitError):
+    except tomllib.TOMLDecodeError:
         pass
     return None
 
@@ -15,6 +15,7 @@ import orjson
 from strong_typing.exception import JsonKeyError, JsonTypeError, JsonValueError
 from strong_typing.serialization import json_to_object, object_to_json
 
+from mcp_json_yaml_toml.backends.base import file_signature
 from mcp_json_yaml_toml.schemas.ide_cache import IDESchemaProvider
 from mcp_json_yaml_toml.schemas.loading import (
     _extract_schema_url_from_content,
@@ -37,12 +38,76 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_SCHEMA_DIR_NAMES = frozenset({"schemas", "jsonSchemas"})
+
+
+def _read_schema_dir(dir_path: str) -> tuple[bool, list[tuple[str, str]]]:
+    """List one directory for the schema scan.
+
+    Entries are classified from the cached ``DirEntry`` type, so no extra
+    stat is needed per entry. Symlinked directories are not returned for
+    descent, as with ``os.walk``.
+
+    Returns:
+        (holds catalog.json or *.schema.json files, [(path, name)] of subdirectories)
+
+    Raises:
+        OSError: If the directory cannot be listed
+    """
+    has_schema_files = False
+    subdirs: list[tuple[str, str]] = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                # Heuristics 2 and 3: catalog.json or *.schema.json files
+                has_schema_files = has_schema_files or (
+                    entry.name == "catalog.json" or entry.name.endswith(".schema.json")
+                )
+            elif not entry.is_symlink():
+                subdirs.append((entry.path, entry.name))
+    return has_schema_files, subdirs
+
+
+def _scan_schema_root(root: Path, max_depth: int) -> list[Path]:
+    """Find schema directories under one root, at most max_depth levels down.
+
+    Walks depth-first with ``os.scandir`` in the same order as a top-down
+    ``os.walk``; unreadable directories are skipped, as with ``os.walk``.
+
+    Args:
+        root: Directory to scan.
+        max_depth: Maximum directory depth below root to inspect.
+
+    Returns:
+        Schema directories in walk order.
+    """
+    found: list[Path] = []
+    stack = [(str(root), root.name, 0)] if max_depth >= 0 else []
+    while stack:
+        dir_path, name, depth = stack.pop()
+        try:
+            has_schema_files, subdirs = _read_schema_dir(dir_path)
+        except OSError:
+            continue
+        # Heuristic 1: Directory is named "schemas" or "jsonSchemas"
+        if has_schema_files or name in _SCHEMA_DIR_NAMES:
+            found.append(Path(dir_path))
+        if depth < max_depth:
+            stack.extend((path, sub, depth + 1) for path, sub in reversed(subdirs))
+    return found
+
 
 class SchemaManager:
     """Manages JSON schemas with local caching and Schema Store integration."""
 
     config: SchemaConfig
     _ide_provider: IDESchemaProvider
+    # Parsed catalog and the catalog file signature it was parsed from
+    _catalog_memo: tuple[tuple[int, int, int], SchemaCatalog | None] | None
 
     def __init__(self, cache_dir: Path | None = None) -> None:
         """Initialize schema manager.
@@ -57,9 +122,11 @@ class SchemaManager:
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.catalog_path = self.cache_dir / "catalog.json"
+        self.catalog_etag_path = self.cache_dir / "catalog.etag"
         self.config_path = self.cache_dir / "schema_config.json"
         self.config = self._load_config()
         self._ide_provider = IDESchemaProvider()
+        self._catalog_memo = None
 
     def _load_config(self) -> SchemaConfig:
         """Load schema configuration from file.
@@ -91,17 +158,44 @@ class SchemaManager:
     def get_catalog(self) -> SchemaCatalog | None:
         """Get the Schema Store catalog as a typed SchemaCatalog dataclass.
 
+        The parsed catalog is kept in memory while the cached catalog file is
+        unchanged and unexpired, so repeated lookups skip reading, parsing
+        and converting it.
+
         Returns:
             SchemaCatalog dataclass if available, None if fetch fails and no cache exists.
         """
+        signature = self._fresh_catalog_signature()
+        if (
+            signature is not None
+            and self._catalog_memo is not None
+            and self._catalog_memo[0] == signature
+        ):
+            return self._catalog_memo[1]
+
         raw_catalog = self._get_raw_catalog()
         if raw_catalog is None:
             return None
+        catalog: SchemaCatalog | None = None
         try:
-            return json_to_object(SchemaCatalog, raw_catalog)
+            catalog = json_to_object(SchemaCatalog, raw_catalog)
         except (JsonKeyError, JsonTypeError, JsonValueError) as e:
             logger.debug("Failed to parse catalog as SchemaCatalog: %s", e)
+
+        signature = self._fresh_catalog_signature()
+        if signature is not None:
+            self._catalog_memo = (signature, catalog)
+        return catalog
+
+    def _fresh_catalog_signature(self) -> tuple[int, int, int] | None:
+        """Return the cached catalog file's signature, or None if missing or expired."""
+        try:
+            stat = self.catalog_path.stat()
+        except OSError:
             return None
+        if time.time() - stat.st_mtime >= CACHE_EXPIRY_SECONDS:
+            return None
+        return file_signature(stat)
 
     def get_ide_provider(self) -> IDESchemaProvider:
         """Get the IDE schema provider instance."""
@@ -273,12 +367,8 @@ class SchemaManager:
             else:
                 return cached
 
-        catalog: Schema | None = None
         try:
-            response = httpx.get(SCHEMA_STORE_CATALOG_URL, timeout=10.0)
-            response.raise_for_status()
-            catalog = response.json()
-            self.catalog_path.write_bytes(orjson.dumps(catalog))
+            return self._fetch_catalog()
         except (
             httpx.HTTPError,
             httpx.TimeoutException,
@@ -294,8 +384,46 @@ class SchemaManager:
                 else:
                     return stale
             return None
+
+    def _fetch_catalog(self) -> Schema:
+        """Fetch the catalog, revalidating the cached copy by ETag when possible.
+
+        A 304 response keeps the cached file and restarts its expiry; a 200
+        response replaces the file and its stored ETag.
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            OSError: If the cache files cannot be read or written
+            orjson.JSONDecodeError: If the catalog is not valid JSON
+        """
+        response = httpx.get(
+            SCHEMA_STORE_CATALOG_URL,
+            timeout=10.0,
+            headers=self._catalog_revalidation_headers(),
+        )
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            cached: Schema = orjson.loads(self.catalog_path.read_bytes())
+            self.catalog_path.touch()
+            return cached
+        response.raise_for_status()
+        catalog: Schema = orjson.loads(response.content)
+        self.catalog_path.write_bytes(orjson.dumps(catalog))
+        if etag := response.headers.get("ETag"):
+            self.catalog_etag_path.write_text(etag, encoding="utf-8")
+        else:
+            self.catalog_etag_path.unlink(missing_ok=True)
         return catalog
 
+    def _catalog_revalidation_headers(self) -> dict[str, str]:
+        """Build If-None-Match headers from the cached catalog's ETag, if any."""
+        if not self.catalog_path.exists():
+            return {}
+        try:
+            etag = self.catalog_etag_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            return {}
+        return {"If-None-Match": etag} if etag else {}
+
     def _get_cache_path_for_url(self, url: str) -> Path:
         """Get the cache path for a schema URL.
 
@@ -539,37 +667,17 @@ class SchemaManager:
         Returns:
             List of discovered schema directories.
         """
-        discovered = []
-
-        for search_path in search_paths:
-            if not search_path.exists() or not search_path.is_dir():
-                continue
-
-            # Recursively find schema directories with improved heuristics
-            for root, dirs, files in os.walk(search_path):
-                # Calculate current depth
-                depth = str(root).count(os.sep) - str(search_path).count(os.sep)
-                if depth > max_depth:
-                    dirs[:] = []  # Don't recurse further
-                    continue
-
-                dir_path = Path(root)
-                is_schema_dir = False
-
-                # Heuristic 1: Directory is named "schemas" or "jsonSchemas"
-                if dir_path.name in {"schemas", "jsonSchemas"}:
-                    is_schema_dir = True
-
-                # Heuristic 2: Directory contains catalog.json
-                if "catalog.json" in files:
-                    is_schema_dir = True
-
-                # Heuristic 3: Directory contains .schema.json files
-                if any(f.endswith(".schema.json") for f in files):
-                    is_schema_dir = True
-
-                if is_schema_dir and dir_path not in discovered:
-                    discovered.append(dir_path)
+        roots = [path for path in search_paths if path.is_dir()]
+        if len(roots) > 1:
+            # Directory walks are I/O-bound, so roots are scanned concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(roots))) as executor:
+                per_root = list(
+                    executor.map(lambda root: _scan_schema_root(root, max_depth), roots)
+                )
+        else:
+            per_root = [_scan_schema_root(root, max_depth) for root in roots]
+        # Keep first-seen order across roots, dropping overlaps
+        discovered = list(dict.fromkeys(path for found in per_root for path in found))
 
         # Update config
         self.config.discovered_dirs = [str(p) for p in discovered]
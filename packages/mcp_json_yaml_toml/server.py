@@ -12,6 +12,7 @@ from fastmcp import FastMCP
 
 from mcp_json_yaml_toml.logging import configure_logging
 from mcp_json_yaml_toml.schemas import SchemaManager
+from mcp_json_yaml_toml.telemetry import configure_telemetry
 
 # ---------------------------------------------------------------------------
 # Core objects — MUST be defined BEFORE tool module imports so that
@@ -20,6 +21,8 @@ from mcp_json_yaml_toml.schemas import SchemaManager
 mcp = FastMCP("mcp-json-yaml-toml", mask_error_details=False)
 schema_manager = SchemaManager()
 _SERVER_START_TIME = datetime.datetime.now(datetime.UTC)
+# Epoch seconds of _SERVER_START_TIME, so meta requests need only time.time()
+_SERVER_START_EPOCH = _SERVER_START_TIME.timestamp()
 
 # ---------------------------------------------------------------------------
 # Tool imports trigger @mcp.tool / @mcp.resource / @mcp.prompt registration.
@@ -46,6 +49,7 @@ from mcp_json_yaml_toml.tools.schema import data_schema  # noqa: E402
 # ---------------------------------------------------------------------------
 __all__ = [
     # Server state
+    "_SERVER_START_EPOCH",
     "_SERVER_START_TIME",
     # Models
     "SchemaResponse",
@@ -78,6 +82,7 @@ __all__ = [
 def main() -> None:  # pragma: no cover
     """Entry point for the MCP server."""
     configure_logging()
+    configure_telemetry()
     mcp.run()
 
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import orjson
 from deepdiff import DeepDiff
 
 __all__ = ["build_diff_statistics", "build_diff_summary", "compute_diff"]
@@ -33,6 +34,68 @@ _CHANGE_LABELS: dict[str, str] = {
 }
 
 
+def _strictly_equal(data1: Any, data2: Any) -> bool:
+    """Return True when two parsed documents match in value and type throughout.
+
+    Python's ``==`` treats ``1``, ``1.0`` and ``True`` as equal where DeepDiff
+    reports type changes, so node types are compared as well. Walks with an
+    explicit stack, stops at the first mismatch, and skips shared subtrees
+    by identity.
+    """
+    stack: list[tuple[Any, Any]] = [(data1, data2)]
+    while stack:
+        left, right = stack.pop()
+        if left is right:
+            continue
+        if type(left) is not type(right):
+            return False
+        if isinstance(left, dict):
+            if left.keys() != right.keys():
+                return False
+            stack.extend((value, right[key]) for key, value in left.items())
+        elif isinstance(left, list):
+            if len(left) != len(right):
+                return False
+            stack.extend(zip(left, right, strict=True))
+        elif left != right:
+            return False
+    return True
+
+
+def _order_free_form(data: Any) -> bytes:
+    """Serialize a parsed document so that list order does not matter.
+
+    Lists become their sorted element forms and mappings their key-sorted
+    entries, so documents equal up to list order share one form. Leaves go
+    through orjson, which keeps ``1``, ``1.0``, ``true`` and ``"1"`` distinct.
+
+    Raises:
+        TypeError: If a leaf or key cannot be serialized or sorted
+    """
+    if isinstance(data, dict):
+        entries = sorted(data.items())
+        return b"{%b}" % b",".join(
+            b"%b:%b" % (orjson.dumps(key), _order_free_form(value))
+            for key, value in entries
+        )
+    if isinstance(data, list):
+        return b"[%b]" % b",".join(sorted(_order_free_form(item) for item in data))
+    return orjson.dumps(data)
+
+
+def _equal_ignoring_order(data1: Any, data2: Any) -> bool:
+    """Return True when two documents are equal as nested multisets.
+
+    One sort per list, O(n log n), instead of DeepDiff's hashing and item
+    pairing. False only means DeepDiff must decide: it also ignores
+    repeated items, which this check does not.
+    """
+    try:
+        return _order_free_form(data1) == _order_free_form(data2)
+    except TypeError:
+        return False
+
+
 def compute_diff(
     data1: Any, data2: Any, *, ignore_order: bool = False
 ) -> dict[str, Any]:
@@ -47,6 +110,11 @@ def compute_diff(
         DeepDiff result as a plain dict (via ``to_dict()``).
         Empty dict when data is identical.
     """
+    # Identical documents, the common case, never reach DeepDiff
+    if _strictly_equal(data1, data2) or (
+        ignore_order and _equal_ignoring_order(data1, data2)
+    ):
+        return {}
     diff = DeepDiff(data1, data2, verbose_level=2, ignore_order=ignore_order)
     return dict(diff.to_dict()) if diff else {}
 
@@ -6,7 +6,7 @@ Extracted from data_operations.py (ARCH-06).
 
 from __future__ import annotations
 
-import datetime
+import time
 from typing import TYPE_CHECKING, Any, Literal, TypeGuard
 
 import orjson
@@ -59,17 +59,14 @@ def _handle_meta_get() -> ServerInfoResponse:
         ServerInfoResponse with version, uptime_seconds, start_time_epoch.
     """
     import mcp_json_yaml_toml  # noqa: PLC0415 — lazy to avoid circular: server -> tools/data -> data_operations -> get_operations -> server
-    from mcp_json_yaml_toml.server import _SERVER_START_TIME  # noqa: PLC0415
-
-    now = datetime.datetime.now(datetime.UTC)
-    uptime = (now - _SERVER_START_TIME).total_seconds()
+    from mcp_json_yaml_toml.server import _SERVER_START_EPOCH  # noqa: PLC0415
 
     return ServerInfoResponse(
         success=True,
         file="-",
         version=mcp_json_yaml_toml.__version__,
-        uptime_seconds=round(uptime, 2),
-        start_time_epoch=round(_SERVER_START_TIME.timestamp(), 3),
+        uptime_seconds=round(time.time() - _SERVER_START_EPOCH, 2),
+        start_time_epoch=round(_SERVER_START_EPOCH, 3),
     )
 
 
@@ -221,9 +218,7 @@ def _handle_data_get_value(
             output_format=output_fmt,
         )
         result_str = (
-            result.stdout
-            if output_fmt != FormatType.JSON
-            else orjson.dumps(result.data, option=orjson.OPT_INDENT_2).decode()
+            result.stdout if output_fmt != FormatType.JSON else result.json_text()
         )
 
         if len(result_str) > PAGE_SIZE_CHARS or cursor is not None:
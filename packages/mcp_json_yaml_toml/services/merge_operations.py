@@ -0,0 +1,146 @@
+"""Merge operations business logic for the data_merge tool.
+
+Deep-merges parsed configuration data in-process using the same rules as
+yq's ``*`` operator: mappings merge recursively, while any other overlay
+value (scalars, lists, null) replaces the base value.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from mcp_json_yaml_toml.backends.base import FormatType, YQResult
+from mcp_json_yaml_toml.backends.yq import execute_yq
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = ["deep_merge", "merge_with_load", "read_merge_inputs"]
+
+
+def deep_merge(base: Any, overlay: Any) -> Any:
+    """Deep-merge overlay into base, mutating base in place.
+
+    Walks nested mappings with an explicit work stack of (destination, source)
+    pairs rather than recursing, so no intermediate dicts are built and deep
+    nesting does not grow the Python call stack. Levels where no mapping meets
+    a mapping are merged with a single ``dict.update`` call.
+
+    Nothing is copied: overlay subtrees with no mapping to merge into are
+    linked into base by reference, and only base mappings that both sides
+    contribute to are mutated. The result may therefore share subtrees with
+    overlay, which callers must not mutate afterwards.
+
+    Args:
+        base: Parsed base document; mutated when it is a dict
+        overlay: Parsed overlay document whose values take precedence
+
+    Returns:
+        base (merged) when both documents are dicts, otherwise overlay
+    """
+    if not (isinstance(base, dict) and isinstance(overlay, dict)):
+        return overlay
+
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(base, overlay)]
+    while stack:
+        dst, src = stack.pop()
+        if not any(
+            isinstance(value, dict) and isinstance(dst.get(key), dict)
+            for key, value in src.items()
+        ):
+            # No mapping meets a mapping at this level: one C-level update
+            dst.update(src)
+            continue
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
+    return base
+
+
+def _loadable_overlay(
+    format1: FormatType, path2: Path, format2: FormatType
+) -> str | None:
+    """Return the overlay path to pass to yq's ``load()``, if one run can merge.
+
+    Only a single-document base (JSON or TOML) with a JSON overlay qualifies:
+    a multi-document YAML base would merge the overlay into every document,
+    and paths that need escaping inside a yq string literal are left alone.
+    """
+    overlay = path2.as_posix()
+    if (
+        format1 == FormatType.YAML
+        or format2 != FormatType.JSON
+        or '"' in overlay
+        or "\\" in overlay
+    ):
+        return None
+    return overlay
+
+
+def merge_with_load(
+    path1: Path,
+    format1: FormatType,
+    path2: Path,
+    format2: FormatType,
+    output_format: FormatType,
+) -> YQResult | None:
+    """Merge two files in one yq run that reads the overlay by path.
+
+    The overlay is referenced through ``load()`` rather than embedded in the
+    expression, so its size never reaches argv and yq renders the merged
+    document straight into the output format.
+
+    Args:
+        path1: Base file
+        format1: Base file format
+        path2: Overlay file
+        format2: Overlay file format
+        output_format: Format to render the merged document in
+
+    Returns:
+        yq result holding the rendered merge, or None when the caller must
+        merge in-process
+
+    Raises:
+        YQExecutionError: If yq fails to read either file
+    """
+    overlay = _loadable_overlay(format1, path2, format2)
+    if overlay is None:
+        return None
+    result = execute_yq(
+        f'. * load("{overlay}")',
+        input_file=path1,
+        input_format=format1,
+        output_format=output_format,
+    )
+    # An empty base produces no document; the in-process path handles it
+    return result if result.stdout else None
+
+
+def read_merge_inputs(
+    path1: Path, format1: FormatType, path2: Path, format2: FormatType
+) -> tuple[Any, Any]:
+    """Parse the base and overlay files for an in-process merge.
+
+    Args:
+        path1: Base file
+        format1: Base file format
+        path2: Overlay file
+        format2: Overlay file format
+
+    Returns:
+        Tuple of (base data, overlay data)
+
+    Raises:
+        YQExecutionError: If yq fails to read either file
+    """
+    result1 = execute_yq(
+        ".", input_file=path1, input_format=format1, output_format=FormatType.JSON
+    )
+    result2 = execute_yq(
+        ".", input_file=path2, input_format=format2, output_format=FormatType.JSON
+    )
+    return result1.data, result2.data
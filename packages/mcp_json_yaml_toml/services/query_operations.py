@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-import orjson
-
 from mcp_json_yaml_toml.backends.base import FormatType
 from mcp_json_yaml_toml.models.responses import DataResponse
 from mcp_json_yaml_toml.services.pagination import (
@@ -39,9 +37,7 @@ def _build_query_response(
         DataResponse model instance
     """
     result_str = (
-        result.stdout
-        if output_format != FormatType.JSON
-        else orjson.dumps(result.data, option=orjson.OPT_INDENT_2).decode()
+        result.stdout if output_format != FormatType.JSON else result.json_text()
     )
 
     if len(result_str) > PAGE_SIZE_CHARS or cursor is not None:
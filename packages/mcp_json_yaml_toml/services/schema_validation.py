@@ -6,6 +6,8 @@ Uses referencing.Registry for $ref resolution via httpx.
 
 from __future__ import annotations
 
+import functools
+import time
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -14,7 +16,7 @@ from jsonschema.exceptions import SchemaError, ValidationError
 from referencing import Registry, Resource
 from referencing.exceptions import NoSuchResource
 
-from mcp_json_yaml_toml.backends.base import FormatType, YQError
+from mcp_json_yaml_toml.backends.base import FormatType, YQError, file_signature
 from mcp_json_yaml_toml.backends.yq import execute_yq
 from mcp_json_yaml_toml.formats.base import (
     MultiDocumentYaml,
@@ -25,6 +27,13 @@ from mcp_json_yaml_toml.formats.base import (
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from jsonschema.protocols import Validator
+
+# Schemas modified this recently are loaded without the validator cache:
+# filesystem timestamps are coarse, so a same-size rewrite within one tick
+# could keep the same signature.
+_SCHEMA_VALIDATOR_MIN_AGE_NS = 2_000_000_000
+
 
 def _validate_against_schema_documents(
     data: Any, schema_path: Path, document_index: int | None = None
@@ -93,6 +102,75 @@ def _validate_against_schema_documents(
     )
 
 
+def _retrieve_via_httpx(uri: str) -> Resource:
+    """Retrieve schema from HTTP(S) URI using httpx."""
+    try:
+        response = httpx.get(uri, follow_redirects=True, timeout=10.0)
+        response.raise_for_status()
+        contents = response.json()
+        return Resource.from_contents(contents)
+    except (httpx.HTTPError, httpx.TimeoutException) as e:
+        raise NoSuchResource(ref=uri) from e
+
+
+@functools.lru_cache(maxsize=64)
+def _schema_validator(
+    schema_path: Path, _signature: tuple[int, int, int]
+) -> Validator | None:
+    """Build a schema validator, cached per (path, file_signature).
+
+    Validating many files against one schema parses the schema and builds
+    the validator once; the signature in the key makes an edited schema
+    load again.
+    """
+    return _load_schema_validator(schema_path)
+
+
+def _get_schema_validator(schema_path: Path) -> Validator | None:
+    """Return the validator for a schema file, cached unless recently modified.
+
+    Raises:
+        OSError: If the schema file cannot be stat-ed
+        YQError: If the schema file cannot be parsed
+    """
+    st = schema_path.stat()
+    if time.time_ns() - st.st_mtime_ns < _SCHEMA_VALIDATOR_MIN_AGE_NS:
+        return _load_schema_validator(schema_path)
+    return _schema_validator(schema_path, file_signature(st))
+
+
+def _load_schema_validator(schema_path: Path) -> Validator | None:
+    """Load a schema file and build its validator.
+
+    Returns:
+        Validator for the schema, or None if the schema file has no content
+
+    Raises:
+        YQError: If the schema file cannot be parsed
+    """
+    schema_format = _detect_file_format(schema_path)
+    schema_result = execute_yq(
+        ".",
+        input_file=schema_path,
+        input_format=schema_format,
+        output_format=FormatType.JSON,
+    )
+    if schema_result.data is None:
+        return None
+
+    schema = schema_result.data
+
+    # Create registry with httpx retrieval for remote $refs
+    registry: Registry = Registry(retrieve=_retrieve_via_httpx)
+
+    # Choose validator based on schema's $schema field or default to Draft 2020-12
+    schema_dialect = schema.get("$schema", "")
+    if "draft-07" in schema_dialect or "draft/7" in schema_dialect:
+        return Draft7Validator(schema, registry=registry)
+    # Default to Draft 2020-12 (current JSON Schema standard)
+    return Draft202012Validator(schema, registry=registry)
+
+
 def _validate_against_schema(data: Any, schema_path: Path) -> tuple[bool, str]:
     """Validate data against JSON schema.
 
@@ -105,42 +183,11 @@ def _validate_against_schema(data: Any, schema_path: Path) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, message)
     """
-
-    def retrieve_via_httpx(uri: str) -> Resource:
-        """Retrieve schema from HTTP(S) URI using httpx."""
-        try:
-            response = httpx.get(uri, follow_redirects=True, timeout=10.0)
-            response.raise_for_status()
-            contents = response.json()
-            return Resource.from_contents(contents)
-        except (httpx.HTTPError, httpx.TimeoutException) as e:
-            raise NoSuchResource(ref=uri) from e
-
     try:
-        # Load schema
-        schema_format = _detect_file_format(schema_path)
-        schema_result = execute_yq(
-            ".",
-            input_file=schema_path,
-            input_format=schema_format,
-            output_format=FormatType.JSON,
-        )
-
-        if schema_result.data is None:
+        validator = _get_schema_validator(schema_path)
+        if validator is None:
             return False, f"Failed to parse schema file: {schema_path}"
-
-        schema = schema_result.data
-
-        # Create registry with httpx retrieval for remote $refs
-        registry: Registry = Registry(retrieve=retrieve_via_httpx)
-
-        # Choose validator based on schema's $schema field or default to Draft 2020-12
-        schema_dialect = schema.get("$schema", "")
-        if "draft-07" in schema_dialect or "draft/7" in schema_dialect:
-            Draft7Validator(schema, registry=registry).validate(data)
-        else:
-            # Default to Draft 2020-12 (current JSON Schema standard)
-            Draft202012Validator(schema, registry=registry).validate(data)
+        validator.validate(data)
 
     except ValidationError as e:
         return False, f"Schema validation failed: {e.message}"
@@ -3,20 +3,28 @@
 Provides a tracer instance and span utilities for yq subprocess visibility.
 Uses FastMCP's built-in telemetry when available, falls back to opentelemetry-api
 (always available as FastMCP transitive dep). Returns no-op tracer when no SDK configured.
+
+opentelemetry is imported on first use rather than at module import, so
+importing the package never pays for it.
 """
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
-from opentelemetry import trace
-
 if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import SpanProcessor
+    from opentelemetry.sdk.trace.export import SpanExporter
     from opentelemetry.trace import Tracer
 
 # Module-level tracer -- no-op when SDK not configured
 _TRACER_NAME = "mcp-json-yaml-toml"
 
+# Batch export settings: spans queue in memory and flush on a background thread
+_BATCH_MAX_QUEUE_SIZE = 2048
+_BATCH_SCHEDULE_DELAY_MILLIS = 5000
+
 
 def get_tracer() -> Tracer:
     """Get the package tracer.
@@ -24,7 +32,81 @@ def get_tracer() -> Tracer:
     Returns a no-op tracer when no OTEL SDK is configured,
     so there is zero overhead for users without telemetry.
     """
+    from opentelemetry import trace  # noqa: PLC0415
+
     return trace.get_tracer(_TRACER_NAME)
 
 
-__all__ = ["get_tracer"]
+def is_tracing_enabled(tracer: Tracer) -> bool:
+    """Report whether spans from this tracer can be recorded.
+
+    ``trace.get_tracer`` hands out a ``ProxyTracer`` while no SDK provider is
+    installed and a ``NoOpTracer`` when the SDK is disabled; spans from either
+    are discarded, so callers can skip span setup entirely.
+
+    Args:
+        tracer: Tracer returned by get_tracer
+
+    Returns:
+        False for proxy and no-op tracers, True otherwise
+    """
+    from opentelemetry import trace  # noqa: PLC0415
+
+    return not isinstance(tracer, (trace.ProxyTracer, trace.NoOpTracer))
+
+
+def _make_span_processor(exporter: SpanExporter) -> SpanProcessor:
+    """Wrap an exporter in the span processor used by the server.
+
+    Spans are exported in batches on a background thread so request handling
+    never waits on the exporter. Set ``MCP_JYT_OTEL_SYNC=1`` to export each
+    span synchronously instead (useful when debugging an exporter).
+
+    Args:
+        exporter: Span exporter to receive finished spans
+
+    Returns:
+        A BatchSpanProcessor, or a SimpleSpanProcessor when sync export is requested
+    """
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor  # noqa: PLC0415
+
+    if os.environ.get("MCP_JYT_OTEL_SYNC", "").strip() == "1":
+        return SimpleSpanProcessor(exporter)
+    return BatchSpanProcessor(
+        exporter,
+        max_queue_size=_BATCH_MAX_QUEUE_SIZE,
+        schedule_delay_millis=_BATCH_SCHEDULE_DELAY_MILLIS,
+    )
+
+
+def configure_telemetry() -> bool:
+    """Install an SDK tracer provider that exports spans over OTLP.
+
+    Only acts when ``OTEL_EXPORTER_OTLP_ENDPOINT`` is set, the optional
+    ``telemetry`` extra is installed, and no SDK provider has been installed
+    already (for example by ``opentelemetry-instrument``).
+
+    Returns:
+        True if a tracer provider was installed, False otherwise
+    """
+    if not os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", "").strip():
+        return False
+    try:
+        from opentelemetry import trace  # noqa: PLC0415
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (  # noqa: PLC0415
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.trace import TracerProvider  # noqa: PLC0415
+    except ImportError:
+        return False
+
+    if isinstance(trace.get_tracer_provider(), TracerProvider):
+        return False
+
+    provider = TracerProvider()
+    provider.add_span_processor(_make_span_processor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+    return True
+
+
+__all__ = ["configure_telemetry", "get_tracer", "is_tracing_enabled"]
@@ -9,11 +9,14 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
+import orjson
 import pytest
 from loguru import logger
 
+from mcp_json_yaml_toml.backends.binary_manager import get_yq_binary_path
+from mcp_json_yaml_toml.caches import clear_caches
 from mcp_json_yaml_toml.config import parse_enabled_formats
 from mcp_json_yaml_toml.tests.mcp_protocol_client import MCPClient
 
@@ -29,6 +32,21 @@ if TYPE_CHECKING:
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+_SAMPLE_JSON_CONFIG_BYTES = json.dumps(
+    {
+        "name": "test-app",
+        "version": "1.0.0",
+        "database": {
+            "host": "localhost",
+            "port": 5432,
+            "credentials": {"username": "admin", "password": "secret"},
+        },
+        "features": {"enabled": True, "beta": False},
+        "servers": ["server1.example.com", "server2.example.com"],
+    },
+    indent=2,
+).encode("utf-8")
+
 
 # ==============================================================================
 # Sample Config Fixtures
@@ -49,23 +67,42 @@ def sample_json_config(tmp_path: Path) -> Path:
     Returns:
         Path to created JSON file
     """
-    config_data = {
-        "name": "test-app",
-        "version": "1.0.0",
-        "database": {
-            "host": "localhost",
-            "port": 5432,
-            "credentials": {"username": "admin", "password": "secret"},
-        },
-        "features": {"enabled": True, "beta": False},
-        "servers": ["server1.example.com", "server2.example.com"],
-    }
-
     file_path = tmp_path / "config.json"
-    file_path.write_text(json.dumps(config_data, indent=2), encoding="utf-8")
+    file_path.write_bytes(_SAMPLE_JSON_CONFIG_BYTES)
     return file_path
 
 
+@pytest.fixture
+def sample_json_config_str(sample_json_config: Path) -> str:
+    """Provide ``sample_json_config`` as a pre-stringified path.
+
+    Tests: Tool calls that take the file path as a string
+    How: Stringify the sample JSON config path once per test
+    Why: Tools accept and echo back ``str`` paths
+
+    Args:
+        sample_json_config: Path to the sample JSON config
+
+    Returns:
+        String form of the sample JSON config path
+    """
+    return str(sample_json_config)
+
+
+@pytest.fixture(scope="session")
+def sample_json_data() -> dict[str, Any]:
+    """Provide the decoded contents of ``sample_json_config``.
+
+    Tests: Read-only assertions against the sample JSON config
+    How: Decode the serialized sample config once per session
+    Why: Avoid re-parsing the same immutable file in every test
+
+    Returns:
+        Decoded sample config; treat as read-only
+    """
+    return cast("dict[str, Any]", orjson.loads(_SAMPLE_JSON_CONFIG_BYTES))
+
+
 @pytest.fixture
 def sample_yaml_config(tmp_path: Path) -> Path:
     """Create sample YAML file for testing.
@@ -376,10 +413,10 @@ def mock_yq_failure(mocker: MockerFixture) -> Any:
 
 @pytest.fixture(autouse=True)
 def _clear_config_cache() -> Generator[None, None, None]:
-    """Clear config cache before and after each test for isolation."""
-    parse_enabled_formats.cache_clear()
+    """Clear package caches before and after each test for isolation."""
+    clear_caches()
     yield
-    parse_enabled_formats.cache_clear()
+    clear_caches()
 
 
 @pytest.fixture
@@ -427,6 +464,39 @@ def multi_format_environment(monkeypatch: pytest.MonkeyPatch) -> None:
     parse_enabled_formats.cache_clear()
 
 
+@pytest.fixture(scope="session")
+def yq_binary_path() -> Path:
+    """Resolve the yq binary once per test session.
+
+    Tests: Tool integration tests that shell out to yq
+    How: Run the normal resolution order (override, cache, PATH, download) once
+    Why: Resolution via system PATH runs ``yq --version`` on every lookup
+
+    Returns:
+        Path to the resolved yq binary
+    """
+    return get_yq_binary_path()
+
+
+@pytest.fixture(scope="module")
+def pinned_yq_binary(yq_binary_path: Path) -> Generator[Path, None, None]:
+    """Pin YQ_BINARY_PATH to the session's resolved yq binary for one module.
+
+    Tests: Modules that invoke yq-backed tools many times
+    How: Set YQ_BINARY_PATH so ``get_yq_binary_path`` takes the override fast path
+    Why: Each tool call then forks only the query itself, not a version probe
+
+    Args:
+        yq_binary_path: Session-resolved yq binary
+
+    Yields:
+        Path to the pinned yq binary
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("YQ_BINARY_PATH", str(yq_binary_path))
+        yield yq_binary_path
+
+
 # ==============================================================================
 # Logging Fixtures
 # ==============================================================================
@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, cast
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, NoReturn, cast
 
 import pytest
 from fastmcp.exceptions import ToolError
 
 from mcp_json_yaml_toml import server
+from mcp_json_yaml_toml.backends.base import FormatType, YQExecutionError
+from mcp_json_yaml_toml.services import diff_operations
 from mcp_json_yaml_toml.services.diff_operations import (
     build_diff_statistics,
     build_diff_summary,
     compute_diff,
 )
+from mcp_json_yaml_toml.tools import diff as diff_tool
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -39,6 +45,19 @@ class TestComputeDiff:
         result = compute_diff({"a": 1, "b": "hello"}, {"a": 1, "b": "hello"})
         assert result == {}
 
+    def test_compute_diff_when_same_object_then_returns_empty(self) -> None:
+        """A document compared with itself produces an empty diff."""
+        data = {"a": [1, {"b": None}], "c": "x"}
+        assert compute_diff(data, data) == {}
+
+    @pytest.mark.parametrize(("left", "right"), [(1, 1.0), (1, True)])
+    def test_compute_diff_when_equal_values_differ_in_type_then_returns_type_changes(
+        self, left: object, right: object
+    ) -> None:
+        """Values equal under == but of different types are still reported."""
+        result = compute_diff({"a": left}, {"a": right})
+        assert "type_changes" in result
+
     def test_compute_diff_when_values_differ_then_returns_values_changed(self) -> None:
         """Changed values appear under values_changed."""
         result = compute_diff({"a": 1, "b": 2}, {"a": 1, "b": 99})
@@ -68,6 +87,27 @@ class TestComputeDiff:
         )
         assert result == {}
 
+    def test_compute_diff_when_ignore_order_and_nested_reorder_then_skips_deepdiff(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Documents equal up to nested list order never reach DeepDiff."""
+
+        def _fail_deepdiff(*_args: object, **_kwargs: object) -> NoReturn:
+            raise AssertionError("DeepDiff should not be called")
+
+        monkeypatch.setattr(diff_operations, "DeepDiff", _fail_deepdiff)
+        data1 = {"jobs": [{"name": "lint", "tags": ["a", "b"]}, {"name": "test"}]}
+        data2 = {"jobs": [{"name": "test"}, {"tags": ["b", "a"], "name": "lint"}]}
+
+        assert compute_diff(data1, data2, ignore_order=True) == {}
+
+    def test_compute_diff_when_ignore_order_and_types_differ_then_reports_change(
+        self,
+    ) -> None:
+        """Reordered lists whose items differ only in type still differ."""
+        result = compute_diff([1, 2], [2, 1.0], ignore_order=True)
+        assert "type_changes" in result
+
     def test_compute_diff_when_ignore_order_false_then_reordered_lists_differ(
         self,
     ) -> None:
@@ -231,3 +271,98 @@ class TestDataDiffTool:
         # With ignore_order -> no differences
         result_unordered = data_diff_fn(str(f1), str(f2), ignore_order=True)
         assert result_unordered.has_differences is False
+
+    def test_data_diff_when_json_files_then_parses_without_yq(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """JSON inputs are parsed in-process, with no yq run."""
+
+        def _fail_execute_yq(*_args: object, **_kwargs: object) -> NoReturn:
+            raise AssertionError("execute_yq should not be called")
+
+        monkeypatch.setattr(diff_tool, "execute_yq", _fail_execute_yq)
+        f1 = tmp_path / "a.json"
+        f2 = tmp_path / "b.json"
+        f1.write_text(json.dumps({"a": 1}))
+        f2.write_text(json.dumps({"a": 2}))
+
+        result = data_diff_fn(str(f1), str(f2))
+        assert result.has_differences is True
+
+    def test_data_diff_when_identical_bytes_then_parses_one_side(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Byte-identical files of one format are reported equal after one parse."""
+        parsed: list[str] = []
+
+        def _fail_parse_pair(*_args: object) -> NoReturn:
+            raise AssertionError("_parse_pair should not be called")
+
+        def _record_parse(path: Path, _file_format: FormatType) -> None:
+            parsed.append(path.name)
+
+        monkeypatch.setattr(diff_tool, "_parse_pair", _fail_parse_pair)
+        monkeypatch.setattr(diff_tool, "_parse_file", _record_parse)
+        content = "name: app\nitems:\n  - 1\n  - 2\n"
+        f1 = tmp_path / "a.yaml"
+        f2 = tmp_path / "b.yaml"
+        f1.write_text(content)
+        f2.write_text(content)
+
+        result = data_diff_fn(str(f1), str(f2))
+        assert result.has_differences is False
+        assert result.differences is None
+        assert parsed == ["a.yaml"]
+
+    def test_data_diff_when_identical_invalid_files_then_raises_parse_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Byte-identical files that fail to parse report the parse error."""
+
+        def _fail_parse(_path: Path, _file_format: FormatType) -> NoReturn:
+            raise YQExecutionError("bad syntax", stderr="", returncode=1)
+
+        monkeypatch.setattr(diff_tool, "_parse_file", _fail_parse)
+        f1 = tmp_path / "a.yaml"
+        f2 = tmp_path / "b.yaml"
+        f1.write_text("key: [unclosed\n")
+        f2.write_text("key: [unclosed\n")
+
+        with pytest.raises(ToolError, match="Diff failed"):
+            data_diff_fn(str(f1), str(f2))
+
+    def test_data_diff_when_rewritten_within_mtime_tick_then_has_differences(
+        self, tmp_path: Path
+    ) -> None:
+        """A same-size rewrite keeping its mtime is not reported identical."""
+        f1 = tmp_path / "a.json"
+        f2 = tmp_path / "b.json"
+        f1.write_text('{"a": 1}')
+        f2.write_text('{"a": 1}')
+        mtime_ns = time.time_ns()
+        os.utime(f2, ns=(mtime_ns, mtime_ns))
+        assert data_diff_fn(str(f1), str(f2)).has_differences is False
+        f2.write_text('{"a": 2}')
+        os.utime(f2, ns=(mtime_ns, mtime_ns))
+
+        result = data_diff_fn(str(f1), str(f2))
+        assert result.has_differences is True
+
+    def test_parse_pair_when_yq_parse_needed_then_second_parse_runs_on_worker(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A YAML input parses the second file on the executor, in order."""
+        threads: dict[str, str] = {}
+
+        def _record_parse(path: Path, _file_format: FormatType) -> str:
+            threads[path.name] = threading.current_thread().name
+            return path.name
+
+        monkeypatch.setattr(diff_tool, "_parse_file", _record_parse)
+
+        result = diff_tool._parse_pair(
+            tmp_path / "a.json", FormatType.JSON, tmp_path / "b.yaml", FormatType.YAML
+        )
+        assert result == ("a.json", "b.yaml")
+        assert threads["a.json"] == threading.current_thread().name
+        assert threads["b.yaml"].startswith("data-diff")
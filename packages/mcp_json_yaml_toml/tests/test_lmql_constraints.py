@@ -171,7 +171,7 @@ class TestIntConstraint:
         result = IntConstraint.validate(value)
         assert result.valid is True
 
-    @pytest.mark.parametrize("value", ["3.14", "abc"])
+    @pytest.mark.parametrize("value", ["3.14", "abc", "\u0663\u0664"])
     def test_int_constraint_when_invalid_then_rejects(self, value: str) -> None:
         result = IntConstraint.validate(value)
         assert result.valid is False
@@ -311,6 +311,70 @@ class TestConstraintRegistry:
         assert "YQ_PATH" in definitions
         assert "name" in definitions["YQ_PATH"]
 
+    def test_registry_when_get_all_definitions_twice_then_reuses_mapping(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # All registry attributes are restored on teardown
+        monkeypatch.setattr(ConstraintRegistry, "_definitions", None)
+        monkeypatch.setattr(ConstraintRegistry, "_definition_list", None)
+        monkeypatch.setattr(
+            ConstraintRegistry, "_constraints", dict(ConstraintRegistry._constraints)
+        )
+        monkeypatch.setattr(
+            ConstraintRegistry, "_validators", dict(ConstraintRegistry._validators)
+        )
+        first = ConstraintRegistry.get_all_definitions()
+        assert ConstraintRegistry.get_all_definitions() is first
+
+        ConstraintRegistry.register("TEST_CACHE_RESET")(
+            create_pattern_constraint("TEST_CACHE_RESET", r"x+")
+        )
+        refreshed = ConstraintRegistry.get_all_definitions()
+        assert refreshed is not first
+        assert "TEST_CACHE_RESET" in refreshed
+
+    def test_registry_when_get_definition_list_twice_then_reuses_list(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # All registry attributes are restored on teardown
+        monkeypatch.setattr(ConstraintRegistry, "_definitions", None)
+        monkeypatch.setattr(ConstraintRegistry, "_definition_list", None)
+        monkeypatch.setattr(
+            ConstraintRegistry, "_constraints", dict(ConstraintRegistry._constraints)
+        )
+        monkeypatch.setattr(
+            ConstraintRegistry, "_validators", dict(ConstraintRegistry._validators)
+        )
+        first = ConstraintRegistry.get_definition_list()
+        assert ConstraintRegistry.get_definition_list() is first
+        assert [d["name"] for d in first] == ConstraintRegistry.list_constraints()
+
+        ConstraintRegistry.register("TEST_LIST_RESET")(
+            create_pattern_constraint("TEST_LIST_RESET", r"x+")
+        )
+        refreshed = ConstraintRegistry.get_definition_list()
+        assert refreshed is not first
+        assert refreshed[-1]["name"] == "TEST_LIST_RESET"
+
+    def test_registry_when_constraint_registered_then_validate_dispatches(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            ConstraintRegistry, "_constraints", dict(ConstraintRegistry._constraints)
+        )
+        monkeypatch.setattr(
+            ConstraintRegistry, "_validators", dict(ConstraintRegistry._validators)
+        )
+        monkeypatch.setattr(ConstraintRegistry, "_definitions", None)
+        monkeypatch.setattr(ConstraintRegistry, "_definition_list", None)
+
+        ConstraintRegistry.register("TEST_DISPATCH")(
+            create_pattern_constraint("TEST_DISPATCH", r"ab+")
+        )
+
+        assert ConstraintRegistry.validate("TEST_DISPATCH", "abb").valid is True
+        assert ConstraintRegistry.validate("TEST_DISPATCH", "ba").valid is False
+
 
 class TestDynamicConstraints:
     """Tests for dynamically created constraints."""
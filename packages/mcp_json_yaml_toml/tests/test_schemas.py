@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import httpx
 
 from mcp_json_yaml_toml.schemas import (
     SchemaManager,
@@ -14,6 +17,7 @@ from mcp_json_yaml_toml.schemas import (
     _get_ide_schema_locations,
     _load_default_ide_patterns,
 )
+from mcp_json_yaml_toml.schemas.scanning import CACHE_EXPIRY_SECONDS
 
 if TYPE_CHECKING:
     import pytest
@@ -533,3 +537,80 @@ class TestIdeSchemaIntegration:
         assert result.source == "ide"
         assert result.name == "test.ext"
         assert "file://" in result.url
+
+
+class TestSchemaCatalogCache:
+    """Tests for in-memory and ETag-revalidated Schema Store catalog caching."""
+
+    def test_get_catalog_when_cache_file_unchanged_then_parses_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify repeated lookups reuse the parsed catalog until the file changes."""
+        manager = SchemaManager(cache_dir=tmp_path / "cache")
+        manager.catalog_path.write_text(json.dumps({"schemas": [], "version": 1}))
+        calls: list[None] = []
+        original = manager._get_raw_catalog
+
+        def _counting_get_raw_catalog() -> dict[str, object] | None:
+            calls.append(None)
+            return original()
+
+        monkeypatch.setattr(manager, "_get_raw_catalog", _counting_get_raw_catalog)
+
+        first = manager.get_catalog()
+        second = manager.get_catalog()
+        manager.catalog_path.write_text(json.dumps({"schemas": [], "version": 20}))
+        third = manager.get_catalog()
+
+        assert first is not None
+        assert second is first
+        assert third is not None
+        assert third.version == 20
+        assert len(calls) == 2
+
+    def test_get_catalog_when_expired_and_not_modified_then_keeps_cached_copy(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify an expired catalog is revalidated by ETag and kept on 304."""
+        manager = SchemaManager(cache_dir=tmp_path / "cache")
+        manager.catalog_path.write_text(json.dumps({"schemas": [], "version": 3}))
+        manager.catalog_etag_path.write_text('"abc"')
+        expired = time.time() - CACHE_EXPIRY_SECONDS - 60
+        os.utime(manager.catalog_path, (expired, expired))
+        sent_headers: list[dict[str, str]] = []
+
+        def _fake_get(url: str, **kwargs: Any) -> httpx.Response:
+            sent_headers.append(kwargs["headers"])
+            return httpx.Response(304, request=httpx.Request("GET", url))
+
+        monkeypatch.setattr(httpx, "get", _fake_get)
+
+        catalog = manager.get_catalog()
+
+        assert catalog is not None
+        assert catalog.version == 3
+        assert sent_headers == [{"If-None-Match": '"abc"'}]
+        assert time.time() - manager.catalog_path.stat().st_mtime < 60
+
+
+class TestScanForSchemaDirs:
+    """Tests for SchemaManager.scan_for_schema_dirs."""
+
+    def test_scan_for_schema_dirs_when_several_roots_then_keeps_walk_order(
+        self, tmp_path: Path
+    ) -> None:
+        """Verify concurrent per-root scans report directories in walk order."""
+        first = tmp_path / "first"
+        (first / "schemas").mkdir(parents=True)
+        (first / "deep" / "er" / "jsonSchemas").mkdir(parents=True)
+        second = tmp_path / "second"
+        (second / "store").mkdir(parents=True)
+        (second / "store" / "catalog.json").write_text("{}")
+        (second / "store" / "app.schema.json").write_text("{}")
+        (second / "linked").symlink_to(first / "schemas")
+        manager = SchemaManager(cache_dir=tmp_path / "cache")
+
+        discovered = manager.scan_for_schema_dirs([first, second, first], max_depth=2)
+
+        assert discovered == [first / "schemas", second / "store"]
+        assert manager.config.discovered_dirs == [str(path) for path in discovered]
@@ -8,25 +8,54 @@ In 2.x, .fn was needed to access the underlying function; in 3.x it's not.
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
 import sys
 import time
 import unittest.mock
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, NoReturn, cast
 
+import orjson
 import pytest
 from fastmcp.exceptions import ToolError
 
-from mcp_json_yaml_toml import server
+from mcp_json_yaml_toml import config, server
+from mcp_json_yaml_toml.formats.base import (
+    _read_file_bytes,
+    resolve_file_path,
+    validate_document_index_for_file,
+)
 from mcp_json_yaml_toml.lmql_constraints import ConstraintRegistry
 from mcp_json_yaml_toml.models.responses import ServerInfoResponse
-from mcp_json_yaml_toml.yq_wrapper import FormatType
+from mcp_json_yaml_toml.schemas import FileAssociation, SchemaConfig
+from mcp_json_yaml_toml.services import merge_operations, schema_validation
+from mcp_json_yaml_toml.services.merge_operations import (
+    deep_merge,
+    merge_with_load,
+    read_merge_inputs,
+)
+from mcp_json_yaml_toml.tools import schema as schema_tool
+from mcp_json_yaml_toml.yq_wrapper import FormatType, YQResult
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from pathlib import Path
 
+# Error-message patterns compiled once and shared by the ``pytest.raises`` checks below.
+_RE_FILE_NOT_FOUND = re.compile(r"File not found")
+_RE_NOT_REGULAR_FILE = re.compile(r"Not a regular file")
+_RE_QUERY_FAILED = re.compile(r"Query failed")
+_RE_FORMAT_DISABLED = re.compile(r"Format 'json' is not enabled")
+_RE_NOT_SUPPORTED = re.compile(r"not supported", re.IGNORECASE)
+_RE_SAME_FORMAT = re.compile(r"Input and output formats are the same")
+_RE_DOCUMENT_INDEX_OUT_OF_RANGE = re.compile(r"Document index 2 out of range")
+_RE_DOCUMENT_INDEX_1_OUT_OF_RANGE = re.compile(r"Document index 1 out of range")
+_RE_DOCUMENT_INDEX_YAML_ONLY = re.compile(
+    r"document_index is only supported for YAML input files"
+)
+
 # FastMCP 3.x: decorators return the original function directly (no .fn needed).
 # At runtime these are callable; cast to satisfy mypy's FunctionTool type.
 data_query_fn = cast("Callable[..., Any]", server.data_query)
@@ -36,12 +65,36 @@ data_convert_fn = cast("Callable[..., Any]", server.data_convert)
 data_merge_fn = cast("Callable[..., Any]", server.data_merge)
 
 
+@functools.cache
+def _make_assoc(schema_url: str) -> FileAssociation:
+    """Return one shared user-sourced FileAssociation per schema URL."""
+    return FileAssociation(schema_url=schema_url, source="user")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_schema_manager_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Give the shared ``server.schema_manager`` a fresh per-test config.
+
+    Several tests mutate ``schema_manager.config`` (associations, custom dirs,
+    catalogs, scan results) and ``_save_config`` persists it to the user cache
+    directory. Pointing both at per-test state keeps these tests independent
+    of each other and safe to run concurrently under ``pytest -n auto``.
+    """
+    monkeypatch.setattr(server.schema_manager, "config", SchemaConfig())
+    monkeypatch.setattr(
+        server.schema_manager, "config_path", tmp_path / "schema_config.json"
+    )
+
+
 class TestDataQuery:
     """Test data_query tool."""
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_query_when_valid_json_then_returns_result(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str, sample_json_data: dict[str, Any]
     ) -> None:
         """Test data_query successfully queries JSON file.
 
@@ -51,17 +104,18 @@ class TestDataQuery:
         """
         # Arrange - sample JSON config
         # Act - query name field
-        result = data_query_fn(str(sample_json_config), ".name")
+        result = data_query_fn(sample_json_config_str, ".name")
 
         # Assert - returns correct data
         assert result["success"] is True
-        assert result["result"] == "test-app"
+        assert result["result"] == sample_json_data["name"]
         assert result["format"] == "json"
-        assert result["file"] == str(sample_json_config)
+        assert result["file"] == sample_json_config_str
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_query_when_nested_field_then_returns_value(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str, sample_json_data: dict[str, Any]
     ) -> None:
         """Test data_query queries nested field.
 
@@ -71,15 +125,16 @@ class TestDataQuery:
         """
         # Arrange - sample config with nested data
         # Act - query nested field
-        result = data_query_fn(str(sample_json_config), ".database.host")
+        result = data_query_fn(sample_json_config_str, ".database.host")
 
         # Assert - returns nested value
         assert result["success"] is True
-        assert result["result"] == "localhost"
+        assert result["result"] == sample_json_data["database"]["host"]
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_query_when_array_index_then_returns_element(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str, sample_json_data: dict[str, Any]
     ) -> None:
         """Test data_query queries array element.
 
@@ -89,13 +144,14 @@ class TestDataQuery:
         """
         # Arrange - config with array
         # Act - query first array element
-        result = data_query_fn(str(sample_json_config), ".servers[0]")
+        result = data_query_fn(sample_json_config_str, ".servers[0]")
 
         # Assert - returns array element
         assert result["success"] is True
-        assert result["result"] == "server1.example.com"
+        assert result["result"] == sample_json_data["servers"][0]
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_query_when_yaml_with_json_output_then_converts(
         self, sample_yaml_config: Path
     ) -> None:
@@ -115,6 +171,7 @@ class TestDataQuery:
         assert result["format"] == "json"
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_query_when_multi_document_yaml_then_returns_all_documents(
         self, sample_multi_document_yaml_config: Path
     ) -> None:
@@ -127,6 +184,7 @@ class TestDataQuery:
         assert result["result"] == ["app-one", "app-two"]
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_query_when_document_index_set_then_queries_specific_document(
         self, sample_multi_document_yaml_config: Path
     ) -> None:
@@ -146,7 +204,7 @@ class TestDataQuery:
         self, sample_multi_document_yaml_config: Path
     ) -> None:
         """Test data_query rejects out-of-range YAML document indexes."""
-        with pytest.raises(ToolError, match=r"Document index 2 out of range"):
+        with pytest.raises(ToolError, match=_RE_DOCUMENT_INDEX_OUT_OF_RANGE):
             data_query_fn(
                 str(sample_multi_document_yaml_config),
                 ".name",
@@ -154,16 +212,67 @@ class TestDataQuery:
                 document_index=2,
             )
 
+    @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
+    def test_data_query_when_document_index_file_rewritten_then_recounts_documents(
+        self, sample_multi_document_yaml_config: Path
+    ) -> None:
+        """Test data_query re-parses a YAML file after it changes on disk.
+
+        Tests: Document count cache invalidation
+        How: Query document 1, rewrite the file with one document, query again
+        Why: Cached counts are keyed on mtime and size, so stale counts must not leak
+        """
+        # Arrange - warm the cache with the two-document file
+        data_query_fn(
+            str(sample_multi_document_yaml_config),
+            ".name",
+            output_format="json",
+            document_index=1,
+        )
+        sample_multi_document_yaml_config.write_text(
+            "name: only-doc\n", encoding="utf-8"
+        )
+
+        # Act & Assert - index 1 no longer exists
+        with pytest.raises(ToolError, match=_RE_DOCUMENT_INDEX_1_OUT_OF_RANGE):
+            data_query_fn(
+                str(sample_multi_document_yaml_config),
+                ".name",
+                output_format="json",
+                document_index=1,
+            )
+
+    def test_validate_document_index_when_rewritten_within_mtime_tick_then_recounts(
+        self, tmp_path: Path
+    ) -> None:
+        """Test a same-size rewrite keeping its mtime is still recounted.
+
+        Tests: Document count cache freshness guard
+        How: Count a recent file, rewrite it to one document of equal size and mtime
+        Why: Coarse mtimes cannot distinguish same-size rewrites within one tick
+        """
+        # Arrange
+        yaml_file = tmp_path / "docs.yaml"
+        yaml_file.write_text("a: 1\n---\nb: 2\n", encoding="utf-8")
+        mtime_ns = time.time_ns()
+        os.utime(yaml_file, ns=(mtime_ns, mtime_ns))
+        validate_document_index_for_file(yaml_file, FormatType.YAML, 1)
+        yaml_file.write_text("a: 1\n#--\nb: 2\n", encoding="utf-8")
+        os.utime(yaml_file, ns=(mtime_ns, mtime_ns))
+
+        # Act & Assert
+        with pytest.raises(ToolError, match=_RE_DOCUMENT_INDEX_1_OUT_OF_RANGE):
+            validate_document_index_for_file(yaml_file, FormatType.YAML, 1)
+
     @pytest.mark.integration
     def test_data_query_when_json_document_index_set_then_raises_tool_error(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str
     ) -> None:
         """Test data_query rejects document_index for non-YAML inputs."""
-        with pytest.raises(
-            ToolError, match="document_index is only supported for YAML input files"
-        ):
+        with pytest.raises(ToolError, match=_RE_DOCUMENT_INDEX_YAML_ONLY):
             data_query_fn(
-                str(sample_json_config), ".name", output_format="json", document_index=0
+                sample_json_config_str, ".name", output_format="json", document_index=0
             )
 
     @pytest.mark.integration
@@ -176,12 +285,13 @@ class TestDataQuery:
         """
         # Arrange - non-existent file path
         # Act & Assert - raises ToolError
-        with pytest.raises(ToolError, match="File not found"):
+        with pytest.raises(ToolError, match=_RE_FILE_NOT_FOUND):
             data_query_fn("/nonexistent/file.json", ".name")
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_query_when_invalid_expression_then_raises_tool_error(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str
     ) -> None:
         """Test data_query raises error for invalid yq expression.
 
@@ -191,24 +301,26 @@ class TestDataQuery:
         """
         # Arrange - sample config
         # Act & Assert - raises ToolError
-        with pytest.raises(ToolError, match="Query failed"):
-            data_query_fn(str(sample_json_config), ".bad[")
+        with pytest.raises(ToolError, match=_RE_QUERY_FAILED):
+            data_query_fn(sample_json_config_str, ".bad[")
 
     def test_data_query_when_format_disabled_then_raises_tool_error(
-        self, sample_json_config: Path, monkeypatch: pytest.MonkeyPatch
+        self, sample_json_config_str: str, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test data_query raises error for disabled format.
 
         Tests: Format filtering enforcement
-        How: Disable JSON format and try to query JSON file
+        How: Stub the enabled-format registry without JSON and query a JSON file
         Why: Verify format restrictions are enforced
         """
-        # Arrange - disable JSON format
-        monkeypatch.setenv("MCP_CONFIG_FORMATS", "yaml,toml")
+        # Arrange - disable JSON format (bypasses MCP_CONFIG_FORMATS parsing)
+        monkeypatch.setattr(
+            config, "parse_enabled_formats", lambda: (FormatType.YAML, FormatType.TOML)
+        )
 
         # Act & Assert - raises ToolError
-        with pytest.raises(ToolError, match="Format 'json' is not enabled"):
-            data_query_fn(str(sample_json_config), ".name")
+        with pytest.raises(ToolError, match=_RE_FORMAT_DISABLED):
+            data_query_fn(sample_json_config_str, ".name")
 
 
 class TestData:
@@ -217,8 +329,9 @@ class TestData:
     # --- GET Operations ---
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_get_when_simple_key_then_returns_value(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str
     ) -> None:
         """Test data get retrieves simple key.
 
@@ -228,15 +341,16 @@ class TestData:
         """
         # Arrange - sample config
         # Act - get name key
-        result = data_fn(str(sample_json_config), operation="get", key_path="name")
+        result = data_fn(sample_json_config_str, operation="get", key_path="name")
 
         # Assert - returns value
         assert result["success"] is True
         assert result["result"] == "test-app"
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_get_when_nested_key_then_returns_value(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str, sample_json_data: dict[str, Any]
     ) -> None:
         """Test data get retrieves nested key.
 
@@ -247,16 +361,17 @@ class TestData:
         # Arrange - config with nested structure
         # Act - get nested key
         result = data_fn(
-            str(sample_json_config), operation="get", key_path="database.port"
+            sample_json_config_str, operation="get", key_path="database.port"
         )
 
         # Assert - returns nested value
         assert result["success"] is True
-        assert result["result"] == 5432
+        assert result["result"] == sample_json_data["database"]["port"]
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_get_when_array_index_then_returns_element(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str, sample_json_data: dict[str, Any]
     ) -> None:
         """Test data get retrieves array element.
 
@@ -266,17 +381,16 @@ class TestData:
         """
         # Arrange - config with array
         # Act - get array element
-        result = data_fn(
-            str(sample_json_config), operation="get", key_path="servers[1]"
-        )
+        result = data_fn(sample_json_config_str, operation="get", key_path="servers[1]")
 
         # Assert - returns element
         assert result["success"] is True
-        assert result["result"] == "server2.example.com"
+        assert result["result"] == sample_json_data["servers"][1]
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_get_when_return_type_keys_then_returns_structure(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str
     ) -> None:
         """Test data get retrieves structure (keys only).
 
@@ -287,7 +401,7 @@ class TestData:
         # Arrange - sample config
         # Act - get structure
         result = data_fn(
-            str(sample_json_config),
+            sample_json_config_str,
             operation="get",
             return_type="keys",
             key_path="database",
@@ -311,24 +425,22 @@ class TestData:
         # Arrange - config with schema
         file_path = tmp_path / "app.json"
         schema_path = tmp_path / "app.schema.json"
-        file_path.write_text(sample_json_config.read_text(encoding="utf-8"))
-        schema_path.write_text(sample_json_schema.read_text(encoding="utf-8"))
+        file_path.write_bytes(sample_json_config.read_bytes())
+        schema_path.write_bytes(sample_json_schema.read_bytes())
 
-        # Manual registration required now that implicit adjacency is removed
-        from mcp_json_yaml_toml import server
-        from mcp_json_yaml_toml.schemas import FileAssociation
+        schema_url = str(schema_path.resolve())
 
-        # Force a fresh config with our association
+        # Manual registration required now that implicit adjacency is removed
         server.schema_manager.config.file_associations[str(file_path.resolve())] = (
-            FileAssociation(schema_url=str(schema_path.resolve()), source="user")
+            _make_assoc(schema_url)
         )
 
         # Mock _fetch_schema to handle our local path "URL"
         original_fetch = server.schema_manager._fetch_schema
 
         def mock_fetch(url: str) -> dict[str, Any] | None:
-            if url == str(schema_path.resolve()):
-                return cast("dict[str, Any]", json.loads(schema_path.read_text()))
+            if url == schema_url:
+                return cast("dict[str, Any]", json.loads(schema_path.read_bytes()))
             return original_fetch(url)
 
         with unittest.mock.patch.object(
@@ -344,6 +456,7 @@ class TestData:
     # --- SET Operations ---
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_set_when_simple_value_then_updates_file(
         self, sample_json_config: Path, tmp_path: Path
     ) -> None:
@@ -371,6 +484,7 @@ class TestData:
         assert modified_data["name"] == "new-name"
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_set_when_nested_value_then_updates_file(
         self, sample_json_config: Path, tmp_path: Path
     ) -> None:
@@ -398,6 +512,7 @@ class TestData:
         assert modified_data["database"]["port"] == 3306
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_set_when_in_place_then_modifies_file(
         self, sample_json_config: Path, tmp_path: Path
     ) -> None:
@@ -423,6 +538,7 @@ class TestData:
         assert modified_data["name"] == "modified"
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_set_when_multi_document_yaml_then_updates_target_document(
         self, sample_multi_document_yaml_config: Path
     ) -> None:
@@ -447,7 +563,7 @@ class TestData:
         self, sample_multi_document_yaml_config: Path
     ) -> None:
         """Test data set rejects out-of-range YAML document indexes."""
-        with pytest.raises(ToolError, match=r"Document index 2 out of range"):
+        with pytest.raises(ToolError, match=_RE_DOCUMENT_INDEX_OUT_OF_RANGE):
             data_fn(
                 str(sample_multi_document_yaml_config),
                 operation="set",
@@ -458,14 +574,12 @@ class TestData:
 
     @pytest.mark.integration
     def test_data_get_when_json_document_index_set_then_raises_tool_error(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str
     ) -> None:
         """Test data rejects document_index for non-YAML inputs."""
-        with pytest.raises(
-            ToolError, match="document_index is only supported for YAML input files"
-        ):
+        with pytest.raises(ToolError, match=_RE_DOCUMENT_INDEX_YAML_ONLY):
             data_fn(
-                str(sample_json_config),
+                sample_json_config_str,
                 operation="get",
                 key_path="name",
                 document_index=0,
@@ -474,6 +588,7 @@ class TestData:
     # --- DELETE Operations ---
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_delete_when_simple_key_then_removes_key(
         self, sample_json_config: Path, tmp_path: Path
     ) -> None:
@@ -500,6 +615,7 @@ class TestData:
         assert "name" in modified_data  # Other keys preserved
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_delete_when_in_place_then_modifies_file(
         self, sample_json_config: Path, tmp_path: Path
     ) -> None:
@@ -526,43 +642,23 @@ class TestData:
     # Note: yq v4.52.2+ supports nested TOML output (earlier versions had scalar-only limitation)
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
+    @pytest.mark.parametrize("output_format", [None, "toml"])
     def test_data_get_when_toml_nested_then_succeeds(
-        self, sample_toml_config: Path
+        self, sample_toml_config: Path, output_format: str | None
     ) -> None:
         """Test data get succeeds with nested TOML structures.
 
         Tests: yq v4.52.2+ can output nested TOML structures
-        How: Get nested object from TOML without specifying output_format
-        Why: Verify yq's improved TOML output support works correctly
+        How: Get nested object from TOML with default and explicit output_format='toml'
+        Why: Verify yq's improved TOML output support works for both request styles
         """
-        # Arrange - TOML file with nested structure
-        # Act - get nested object without specifying output format (defaults to TOML)
-        result = data_fn(str(sample_toml_config), operation="get", key_path="database")
-
-        # Assert - TOML output succeeds with nested structures (yq v4.52.2+ improvement)
-        assert result["success"] is True
-        assert result["format"] == FormatType.TOML
-        assert isinstance(result["result"], str)  # TOML output is serialized as string
-        assert "host" in result["result"]
-        assert "localhost" in result["result"]
+        # Arrange - TOML file with nested structure; None exercises the default (TOML)
+        kwargs = {"output_format": output_format} if output_format else {}
 
-    @pytest.mark.integration
-    def test_data_get_when_toml_explicit_format_then_succeeds(
-        self, sample_toml_config: Path
-    ) -> None:
-        """Test data get succeeds when TOML output explicitly requested for nested data.
-
-        Tests: yq v4.52.2+ can output nested TOML structures
-        How: Get nested object from TOML with explicit output_format='toml'
-        Why: Verify explicit TOML requests work for nested data
-        """
-        # Arrange - TOML file with nested structure
-        # Act - explicitly request TOML output for nested data
+        # Act - get nested object
         result = data_fn(
-            str(sample_toml_config),
-            operation="get",
-            key_path="database",
-            output_format="toml",
+            str(sample_toml_config), operation="get", key_path="database", **kwargs
         )
 
         # Assert - TOML output succeeds with nested structures (yq v4.52.2+ improvement)
@@ -573,41 +669,22 @@ class TestData:
         assert "localhost" in result["result"]
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
+    @pytest.mark.parametrize("output_format", [None, "toml"])
     def test_data_query_when_toml_nested_then_succeeds(
-        self, sample_toml_config: Path
+        self, sample_toml_config: Path, output_format: str | None
     ) -> None:
         """Test data_query succeeds with nested TOML structures.
 
         Tests: yq v4.52.2+ can output nested TOML structures
-        How: Query nested object from TOML without specifying output_format
+        How: Query nested object from TOML with default and explicit output_format='toml'
         Why: Verify data_query benefits from yq's improved TOML output support
         """
-        # Arrange - TOML file with nested structure
-        # Act - query nested object without specifying output format
-        result = data_query_fn(str(sample_toml_config), ".database")
+        # Arrange - TOML file with nested structure; None exercises the default (TOML)
+        kwargs = {"output_format": output_format} if output_format else {}
 
-        # Assert - TOML output succeeds with nested structures (yq v4.52.2+ improvement)
-        assert result["success"] is True
-        assert result["format"] == FormatType.TOML
-        assert isinstance(result["result"], str)  # TOML output is serialized as string
-        assert "host" in result["result"]
-        assert "localhost" in result["result"]
-
-    @pytest.mark.integration
-    def test_data_query_when_toml_explicit_format_then_succeeds(
-        self, sample_toml_config: Path
-    ) -> None:
-        """Test data_query succeeds when TOML output explicitly requested.
-
-        Tests: yq v4.52.2+ can output nested TOML structures
-        How: Query nested object with explicit output_format='toml'
-        Why: Verify data_query can handle explicit TOML requests for nested data
-        """
-        # Arrange - TOML file with nested structure
-        # Act - explicitly request TOML output
-        result = data_query_fn(
-            str(sample_toml_config), ".database", output_format="toml"
-        )
+        # Act - query nested object
+        result = data_query_fn(str(sample_toml_config), ".database", **kwargs)
 
         # Assert - TOML output succeeds with nested structures (yq v4.52.2+ improvement)
         assert result["success"] is True
@@ -617,6 +694,7 @@ class TestData:
         assert "localhost" in result["result"]
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_get_when_toml_scalar_then_no_fallback(
         self, sample_toml_config: Path
     ) -> None:
@@ -640,68 +718,7 @@ class TestDataSchema:
     """Test unified data_schema tool."""
 
     @pytest.mark.integration
-    def test_data_schema_when_valid_syntax_then_passes(
-        self, sample_json_config: Path
-    ) -> None:
-        """Test data_schema validate passes for valid file.
-
-        Tests: Valid file validation
-        How: Validate syntactically correct JSON
-        Why: Verify validation succeeds for valid files
-        """
-        # Arrange - valid JSON config
-        # Act - validate
-        result = data_schema_fn(action="validate", file_path=str(sample_json_config))
-
-        # Assert - validation passes
-        assert result["syntax_valid"] is True
-        assert result["overall_valid"] is True
-        assert "Syntax is valid" in result["syntax_message"]
-
-    @pytest.mark.integration
-    def test_data_schema_when_invalid_syntax_then_fails(
-        self, invalid_json_config: Path
-    ) -> None:
-        """Test data_schema validate fails for invalid syntax.
-
-        Tests: Invalid syntax detection
-        How: Validate malformed JSON
-        Why: Verify syntax errors are caught
-        """
-        # Arrange - invalid JSON
-        # Act - validate
-        result = data_schema_fn(action="validate", file_path=str(invalid_json_config))
-
-        # Assert - validation fails
-        assert result["syntax_valid"] is False
-        assert result["overall_valid"] is False
-        assert "Syntax error" in result["syntax_message"]
-
-    @pytest.mark.integration
-    def test_data_schema_when_valid_against_schema_then_passes(
-        self, sample_json_config: Path, sample_json_schema: Path
-    ) -> None:
-        """Test data_schema validate with matching schema.
-
-        Tests: Schema validation success
-        How: Validate config against matching schema
-        Why: Verify schema validation works
-        """
-        # Arrange - valid config and matching schema
-        # Act - validate with schema
-        result = data_schema_fn(
-            action="validate",
-            file_path=str(sample_json_config),
-            schema_path=str(sample_json_schema),
-        )
-
-        # Assert - passes schema validation
-        assert result["syntax_valid"] is True
-        assert result["schema_validated"] is True
-        assert result["overall_valid"] is True
-        assert "Schema validation passed" in result["schema_message"]
-
-    @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_schema_when_multi_document_yaml_then_validates_each_document(
         self,
         sample_multi_document_yaml_config: Path,
@@ -721,6 +738,7 @@ class TestDataSchema:
         assert len(result["document_results"]) == 2
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_schema_when_multi_document_yaml_with_schema_paths_then_uses_per_document_schema(
         self,
         sample_multi_document_yaml_config: Path,
@@ -740,6 +758,7 @@ class TestDataSchema:
         assert len(result["document_results"]) == 2
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_schema_when_json_array_root_then_validates_as_single_document(
         self, tmp_path: Path
     ) -> None:
@@ -775,17 +794,159 @@ class TestDataSchema:
         assert result["overall_valid"] is True
         assert "document_results" not in result
 
+    def test_data_schema_when_json_validated_then_skips_yq(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_json_config_str: str,
+        sample_json_schema: Path,
+    ) -> None:
+        """Test JSON validation is answered from the shared identity cache.
+
+        Tests: In-process syntax check for JSON
+        How: Validate a JSON file while execute_yq raises, with the schema load stubbed
+        Why: data_query, data_diff and validate share one parse per file signature
+        """
+
+        # Arrange
+        def _fail_execute_yq(*_args: object, **_kwargs: object) -> NoReturn:
+            raise AssertionError("execute_yq must not run for JSON input")
+
+        def _load_schema(_expression: str, **kwargs: object) -> YQResult:
+            schema_file = cast("Path", kwargs["input_file"])
+            return YQResult(stdout="", data=orjson.loads(schema_file.read_bytes()))
+
+        monkeypatch.setattr(schema_tool, "execute_yq", _fail_execute_yq)
+        monkeypatch.setattr(schema_validation, "execute_yq", _load_schema)
+
+        # Act
+        result = data_schema_fn(
+            action="validate",
+            file_path=sample_json_config_str,
+            schema_path=str(sample_json_schema),
+        )
+
+        # Assert
+        assert result["syntax_valid"] is True
+        assert result["schema_validated"] is True
+        assert result["overall_valid"] is True
+
+    @pytest.mark.parametrize(
+        ("file_name", "content", "syntax_valid"),
+        [
+            ("config.yaml", "name: app\nport: 8080\n", True),
+            ("config.yaml", "name: [unclosed\n", False),
+            ("config.toml", 'name = "app"\nport = 8080\n', True),
+            ("config.toml", "name = \n", False),
+        ],
+    )
+    def test_data_schema_when_yaml_or_toml_validated_then_checks_syntax_in_process(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        file_name: str,
+        content: str,
+        syntax_valid: bool,
+    ) -> None:
+        """Test YAML and TOML syntax is checked by the validation parse itself.
+
+        Tests: In-process syntax check for YAML and TOML
+        How: Validate valid and broken files while execute_yq raises
+        Why: The parse schema validation needs already proves the syntax
+        """
+
+        # Arrange
+        def _fail_execute_yq(*_args: object, **_kwargs: object) -> NoReturn:
+            raise AssertionError("execute_yq must not run for YAML or TOML input")
+
+        monkeypatch.setattr(schema_tool, "execute_yq", _fail_execute_yq)
+        file_path = tmp_path / file_name
+        file_path.write_text(content, encoding="utf-8")
+
+        # Act
+        result = data_schema_fn(action="validate", file_path=str(file_path))
+
+        # Assert
+        assert result["syntax_valid"] is syntax_valid
+        assert result["overall_valid"] is syntax_valid
+        assert result["syntax_message"].startswith(
+            "Syntax is valid" if syntax_valid else "Syntax error"
+        )
+
+    def test_validate_against_schema_when_schema_unchanged_then_builds_validator_once(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test one schema validating many documents is loaded a single time.
+
+        Tests: Validator cache keyed by schema file signature
+        How: Count schema loads across validations, then edit the schema
+        Why: Validate-in-a-loop runs should not re-parse and rebuild the schema
+        """
+        # Arrange
+        loads: list[object] = []
+        schemas = [{"type": "object"}, {"type": "array"}]
+
+        def _fake_execute_yq(_expression: str, **kwargs: object) -> YQResult:
+            loads.append(kwargs["input_file"])
+            return YQResult(stdout="", data=schemas[len(loads) - 1])
+
+        monkeypatch.setattr(schema_validation, "execute_yq", _fake_execute_yq)
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text('{"type": "object"}', encoding="utf-8")
+        os.utime(schema_path, ns=(1_000_000_000, 1_000_000_000))
+
+        # Act
+        first = schema_validation._validate_against_schema({"a": 1}, schema_path)
+        second = schema_validation._validate_against_schema([1], schema_path)
+        schema_path.write_text('{"type": "array" }', encoding="utf-8")
+        os.utime(schema_path, ns=(2_000_000_000, 2_000_000_000))
+        third = schema_validation._validate_against_schema([1], schema_path)
+
+        # Assert
+        assert first == (True, "Schema validation passed")
+        assert second[0] is False
+        assert third == (True, "Schema validation passed")
+        assert len(loads) == 2
+
+    def test_validate_against_schema_when_rewritten_within_mtime_tick_then_reloads(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test a same-size schema rewrite keeping its mtime is loaded again.
+
+        Tests: Validator cache freshness guard
+        How: Validate against a recent schema, rewrite it with equal size and mtime
+        Why: Coarse mtimes cannot distinguish same-size rewrites within one tick
+        """
+        # Arrange
+        schemas = [{"type": "object"}, {"type": "array"}]
+
+        def _fake_execute_yq(_expression: str, **kwargs: object) -> YQResult:
+            text = cast("Path", kwargs["input_file"]).read_text(encoding="utf-8")
+            return YQResult(stdout="", data=schemas["array" in text])
+
+        monkeypatch.setattr(schema_validation, "execute_yq", _fake_execute_yq)
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text('{"type": "object"}', encoding="utf-8")
+        mtime_ns = time.time_ns()
+        os.utime(schema_path, ns=(mtime_ns, mtime_ns))
+        schema_validation._validate_against_schema({"a": 1}, schema_path)
+        schema_path.write_text('{"type": "array" }', encoding="utf-8")
+        os.utime(schema_path, ns=(mtime_ns, mtime_ns))
+
+        # Act
+        result = schema_validation._validate_against_schema([1], schema_path)
+
+        # Assert
+        assert result == (True, "Schema validation passed")
+
     @pytest.mark.integration
     def test_data_schema_when_json_document_index_set_then_raises_tool_error(
-        self, sample_json_config: Path, sample_json_schema: Path
+        self, sample_json_config_str: str, sample_json_schema: Path
     ) -> None:
         """Test data_schema rejects document_index for non-YAML inputs."""
-        with pytest.raises(
-            ToolError, match="document_index is only supported for YAML input files"
-        ):
+        with pytest.raises(ToolError, match=_RE_DOCUMENT_INDEX_YAML_ONLY):
             data_schema_fn(
                 action="validate",
-                file_path=str(sample_json_config),
+                file_path=sample_json_config_str,
                 schema_path=str(sample_json_schema),
                 document_index=0,
             )
@@ -814,82 +975,133 @@ class TestDataSchema:
         assert "requires multi-document YAML input" in result["schema_message"]
 
     @pytest.mark.integration
-    def test_data_schema_when_scan_then_finds_schemas(self, tmp_path: Path) -> None:
-        """Test data_schema scan finds schemas.
-
-        Tests: Schema scanning
-        How: Scan directory with schemas
-        Why: Verify scanning works
-        """
-        # Arrange - create schema file
-        schema_path = tmp_path / "test.schema.json"
-        schema_path.write_text("{}")
-
-        # Act - scan
-        result = data_schema_fn(action="scan", search_paths=[str(tmp_path)])
+    @pytest.mark.usefixtures("pinned_yq_binary")
+    def test_data_schema_when_valid_against_schema_then_passes(
+        self, sample_json_config_str: str, sample_json_schema: Path
+    ) -> None:
+        """Test data_schema validates a JSON file against its schema file."""
+        result = data_schema_fn(
+            action="validate",
+            file_path=sample_json_config_str,
+            schema_path=str(sample_json_schema),
+        )
 
-        # Assert - finds schema dir
-        assert result["success"] is True
-        assert result["discovered_count"] > 0
-        assert str(tmp_path) in result["discovered_dirs"]
+        assert result["syntax_valid"] is True
+        assert result["schema_validated"] is True
+        assert result["overall_valid"] is True
+        assert "Schema validation passed" in result["schema_message"]
 
     @pytest.mark.integration
-    def test_data_schema_when_add_dir_then_registers(self, tmp_path: Path) -> None:
-        """Test data_schema add_dir adds directory.
+    @pytest.mark.parametrize(
+        ("action", "kwargs", "checks"),
+        [
+            pytest.param(
+                "validate",
+                {"file_path": "{json}"},  # noqa: RUF027 — literal placeholder, not an f-string
+                [
+                    ("syntax_valid", "is", True),
+                    ("overall_valid", "is", True),
+                    ("syntax_message", "contains", "Syntax is valid"),
+                ],
+                id="valid_syntax",
+            ),
+            pytest.param(
+                "validate",
+                {"file_path": "{bad_json}"},
+                [
+                    ("syntax_valid", "is", False),
+                    ("overall_valid", "is", False),
+                    ("syntax_message", "contains", "Syntax error"),
+                ],
+                id="invalid_syntax",
+            ),
+            pytest.param(
+                "scan",
+                {"search_paths": ["{tmp}"]},
+                [
+                    ("success", "is", True),
+                    ("discovered_count", ">", 0),
+                    ("discovered_dirs", "contains", "{tmp}"),
+                ],
+                id="scan",
+            ),
+            pytest.param(
+                "add_dir",
+                {"path": "{tmp}"},
+                [("success", "is", True), ("directory", "==", "{tmp}")],
+                id="add_dir",
+            ),
+            pytest.param(
+                "add_catalog",
+                {"name": "test", "uri": "http://example.com/catalog.json"},
+                [("success", "is", True), ("name", "==", "test")],
+                id="add_catalog",
+            ),
+            pytest.param(
+                "list",
+                {},
+                [("success", "is", True), ("config", "present", None)],
+                id="list",
+            ),
+        ],
+    )
+    def test_data_schema_when_action_then_returns_expected(
+        self,
+        action: str,
+        kwargs: dict[str, Any],
+        checks: list[tuple[str, str, Any]],
+        sample_json_config_str: str,
+        invalid_json_config: Path,
+        sample_json_schema: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test data_schema actions against a table of expected response fields.
 
-        Tests: Add schema directory
-        How: Add custom directory
-        Why: Verify directory registration
+        Tests: validate, scan, add_dir, add_catalog and list actions
+        How: Substitute fixture paths into each case's kwargs and check fields
+        Why: One parametrized test covers the shared call-and-check skeleton
         """
-        # Arrange - directory
-        # Act - add dir
-        result = data_schema_fn(action="add_dir", path=str(tmp_path))
-
-        # Assert - added
-        assert result["success"] is True
-        assert result["directory"] == str(tmp_path)
+        # Arrange - resolve path placeholders (sample_json_schema lives in tmp_path)
+        placeholders = {
+            "{json}": sample_json_config_str,  # noqa: RUF027 — literal placeholder, not an f-string
+            "{bad_json}": str(invalid_json_config),
+            "{tmp}": str(tmp_path),
+        }
 
-    @pytest.mark.integration
-    def test_data_schema_when_add_catalog_then_registers(self) -> None:
-        """Test data_schema add_catalog adds catalog.
+        def fill(value: Any) -> Any:
+            if isinstance(value, list):
+                return [fill(item) for item in value]
+            return placeholders.get(value, value) if isinstance(value, str) else value
 
-        Tests: Add schema catalog
-        How: Add custom catalog
-        Why: Verify catalog registration
-        """
-        # Arrange
-        # Act - add catalog
+        # Act
         result = data_schema_fn(
-            action="add_catalog", name="test", uri="http://example.com/catalog.json"
+            action=action, **{key: fill(value) for key, value in kwargs.items()}
         )
 
-        # Assert - added
-        assert result["success"] is True
-        assert result["name"] == "test"
-
-    @pytest.mark.integration
-    def test_data_schema_when_list_then_returns_config(self) -> None:
-        """Test data_schema list shows config.
-
-        Tests: List configuration
-        How: List schemas
-        Why: Verify list operation
-        """
-        # Arrange
-        # Act - list
-        result = data_schema_fn(action="list")
-
-        # Assert - returns config
-        assert result["success"] is True
-        assert "config" in result
+        # Assert
+        for key, op, expected in checks:
+            match op:
+                case "is":
+                    assert result[key] is expected, key
+                case "==":
+                    assert result[key] == fill(expected), key
+                case "contains":
+                    assert fill(expected) in result[key], key
+                case ">":
+                    assert result[key] > expected, key
+                case "present":
+                    assert key in result
+                case _:
+                    pytest.fail(f"unknown op {op}")
 
 
 class TestDataConvert:
     """Test data_convert tool."""
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_convert_when_json_to_yaml_then_converts(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str
     ) -> None:
         """Test data_convert converts JSON to YAML.
 
@@ -899,7 +1111,7 @@ class TestDataConvert:
         """
         # Arrange - JSON config
         # Act - convert to YAML
-        result = data_convert_fn(str(sample_json_config), "yaml")
+        result = data_convert_fn(sample_json_config_str, "yaml")
 
         # Assert - conversion successful
         assert result["success"] is True
@@ -908,6 +1120,7 @@ class TestDataConvert:
         assert "name: test-app" in result["result"]
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_convert_when_yaml_to_json_then_converts(
         self, sample_yaml_config: Path
     ) -> None:
@@ -931,7 +1144,7 @@ class TestDataConvert:
 
     @pytest.mark.integration
     def test_data_convert_when_json_to_toml_then_raises_error(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str
     ) -> None:
         """Test data_convert rejects JSON to TOML conversion.
 
@@ -942,15 +1155,16 @@ class TestDataConvert:
         # Arrange - JSON config
         # Act & Assert - conversion rejected with clear message
         with pytest.raises(ToolError) as exc_info:
-            data_convert_fn(str(sample_json_config), "toml")
+            data_convert_fn(sample_json_config_str, "toml")
 
         error_message = str(exc_info.value)
-        assert "not supported" in error_message.lower()
+        assert _RE_NOT_SUPPORTED.search(error_message)
         assert "TOML" in error_message
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_convert_when_output_file_then_writes(
-        self, sample_json_config: Path, tmp_path: Path
+        self, sample_json_config_str: str, tmp_path: Path
     ) -> None:
         """Test data_convert writes to output file.
 
@@ -963,7 +1177,7 @@ class TestDataConvert:
 
         # Act - convert with output file
         result = data_convert_fn(
-            str(sample_json_config), "yaml", output_file=str(output_file)
+            sample_json_config_str, "yaml", output_file=str(output_file)
         )
 
         # Assert - file written
@@ -975,7 +1189,7 @@ class TestDataConvert:
 
     @pytest.mark.integration
     def test_data_convert_when_same_format_then_raises_error(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str
     ) -> None:
         """Test data_convert rejects same input/output format.
 
@@ -985,8 +1199,8 @@ class TestDataConvert:
         """
         # Arrange - JSON config
         # Act & Assert - raises ToolError
-        with pytest.raises(ToolError, match="Input and output formats are the same"):
-            data_convert_fn(str(sample_json_config), "json")
+        with pytest.raises(ToolError, match=_RE_SAME_FORMAT):
+            data_convert_fn(sample_json_config_str, "json")
 
     @pytest.mark.integration
     def test_data_convert_when_file_missing_then_raises_error(self) -> None:
@@ -998,7 +1212,7 @@ class TestDataConvert:
         """
         # Arrange - non-existent file
         # Act & Assert - raises ToolError
-        with pytest.raises(ToolError, match="File not found"):
+        with pytest.raises(ToolError, match=_RE_FILE_NOT_FOUND):
             data_convert_fn("/nonexistent/file.json", "yaml")
 
 
@@ -1006,8 +1220,9 @@ class TestDataMerge:
     """Test data_merge tool."""
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_merge_when_two_json_files_then_merges(
-        self, sample_json_config: Path, tmp_path: Path
+        self, sample_json_config_str: str, tmp_path: Path
     ) -> None:
         """Test data_merge merges two JSON files.
 
@@ -1018,20 +1233,21 @@ class TestDataMerge:
         # Arrange - two JSON configs
         file1 = tmp_path / "config1.json"
         file2 = tmp_path / "config2.json"
-        file1.write_text(json.dumps({"name": "app1", "version": "1.0"}))
-        file2.write_text(json.dumps({"version": "2.0", "author": "test"}))
+        file1.write_bytes(orjson.dumps({"name": "app1", "version": "1.0"}))
+        file2.write_bytes(orjson.dumps({"version": "2.0", "author": "test"}))
 
         # Act - merge files
         result = data_merge_fn(str(file1), str(file2), output_format="json")
 
         # Assert - merged correctly
         assert result["success"] is True
-        merged_data = json.loads(result["result"])
+        merged_data = orjson.loads(result["result"])
         assert merged_data["name"] == "app1"  # From file1
         assert merged_data["version"] == "2.0"  # Overridden by file2
         assert merged_data["author"] == "test"  # Added from file2
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_merge_when_nested_objects_then_deep_merges(
         self, tmp_path: Path
     ) -> None:
@@ -1044,21 +1260,24 @@ class TestDataMerge:
         # Arrange - configs with nested objects
         file1 = tmp_path / "config1.json"
         file2 = tmp_path / "config2.json"
-        file1.write_text(json.dumps({"database": {"host": "localhost", "port": 5432}}))
-        file2.write_text(json.dumps({"database": {"port": 3306, "user": "admin"}}))
+        file1.write_bytes(
+            orjson.dumps({"database": {"host": "localhost", "port": 5432}})
+        )
+        file2.write_bytes(orjson.dumps({"database": {"port": 3306, "user": "admin"}}))
 
         # Act - merge
         result = data_merge_fn(str(file1), str(file2), output_format="json")
 
         # Assert - deep merged
-        merged_data = json.loads(result["result"])
+        merged_data = orjson.loads(result["result"])
         assert merged_data["database"]["host"] == "localhost"  # Preserved
         assert merged_data["database"]["port"] == 3306  # Overridden
         assert merged_data["database"]["user"] == "admin"  # Added
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_merge_when_different_formats_then_merges(
-        self, sample_json_config: Path, sample_yaml_config: Path
+        self, sample_json_config_str: str, sample_yaml_config: Path
     ) -> None:
         """Test data_merge merges different formats.
 
@@ -1069,16 +1288,17 @@ class TestDataMerge:
         # Arrange - JSON and YAML configs
         # Act - merge different formats
         result = data_merge_fn(
-            str(sample_json_config), str(sample_yaml_config), output_format="json"
+            sample_json_config_str, str(sample_yaml_config), output_format="json"
         )
 
         # Assert - merged successfully
         assert result["success"] is True
-        merged_data = json.loads(result["result"])
+        merged_data = orjson.loads(result["result"])
         assert "name" in merged_data
         assert "database" in merged_data
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_merge_when_output_file_then_writes(self, tmp_path: Path) -> None:
         """Test data_merge writes to output file.
 
@@ -1090,8 +1310,8 @@ class TestDataMerge:
         file1 = tmp_path / "config1.json"
         file2 = tmp_path / "config2.json"
         output_file = tmp_path / "merged.json"
-        file1.write_text(json.dumps({"key1": "value1"}))
-        file2.write_text(json.dumps({"key2": "value2"}))
+        file1.write_bytes(orjson.dumps({"key1": "value1"}))
+        file2.write_bytes(orjson.dumps({"key2": "value2"}))
 
         # Act - merge with output file
         result = data_merge_fn(str(file1), str(file2), output_file=str(output_file))
@@ -1100,13 +1320,13 @@ class TestDataMerge:
         assert result["success"] is True
         assert result["output_file"] == str(output_file)
         assert output_file.exists()
-        merged_data = json.loads(output_file.read_text())
+        merged_data = orjson.loads(output_file.read_bytes())
         assert "key1" in merged_data
         assert "key2" in merged_data
 
     @pytest.mark.integration
     def test_data_merge_when_file_missing_then_raises_error(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str
     ) -> None:
         """Test data_merge raises error if first file missing.
 
@@ -1116,8 +1336,274 @@ class TestDataMerge:
         """
         # Arrange - non-existent first file
         # Act & Assert - raises ToolError
-        with pytest.raises(ToolError, match="File not found"):
-            data_merge_fn("/nonexistent/file.json", str(sample_json_config))
+        with pytest.raises(ToolError, match=_RE_FILE_NOT_FOUND):
+            data_merge_fn("/nonexistent/file.json", sample_json_config_str)
+
+    def test_data_merge_when_path_is_directory_then_raises_error(
+        self, tmp_path: Path, sample_json_config_str: str
+    ) -> None:
+        """Test data_merge rejects a directory before running yq.
+
+        Tests: Regular-file validation
+        How: Merge with a directory as the overlay path
+        Why: The single stat check must catch non-files, not only missing paths
+        """
+        # Arrange - an existing directory named like a JSON file
+        directory = tmp_path / "overlay.json"
+        directory.mkdir()
+
+        # Act & Assert - raises ToolError
+        with pytest.raises(ToolError, match=_RE_NOT_REGULAR_FILE):
+            data_merge_fn(sample_json_config_str, str(directory))
+
+
+class TestDeepMerge:
+    """Test the in-process deep merge behind data_merge."""
+
+    def test_deep_merge_when_nested_dicts_then_merges_in_place(self) -> None:
+        """Test deep_merge merges nested mappings into the base.
+
+        Tests: Recursive mapping merge
+        How: Merge overlay with nested overrides and additions
+        Why: Nested keys from both sides must survive, overlay wins on conflict
+        """
+        # Arrange
+        base: dict[str, Any] = {"db": {"host": "a", "pool": {"min": 1}}, "name": "x"}
+        overlay = {"db": {"port": 5432, "pool": {"max": 9}}, "debug": True}
+
+        # Act
+        result = deep_merge(base, overlay)
+
+        # Assert
+        assert result is base
+        assert result == {
+            "db": {"host": "a", "pool": {"min": 1, "max": 9}, "port": 5432},
+            "name": "x",
+            "debug": True,
+        }
+
+    def test_deep_merge_when_overlay_not_mapping_then_replaces(self) -> None:
+        """Test deep_merge replaces lists, nulls and type mismatches.
+
+        Tests: Non-mapping overlay values
+        How: Merge overlay values that are lists, null, and scalars over dicts
+        Why: Matches yq's multiply operator, which only merges mappings
+        """
+        # Arrange
+        base: dict[str, Any] = {"items": [1, 2], "opt": "on", "sub": {"a": 1}}
+        overlay = {"items": [3], "opt": None, "sub": 5}
+
+        # Act
+        result = deep_merge(base, overlay)
+
+        # Assert
+        assert result == {"items": [3], "opt": None, "sub": 5}
+        assert deep_merge([1], {"a": 1}) == {"a": 1}
+
+    def test_deep_merge_when_subtree_unshared_then_links_without_copy(self) -> None:
+        """Test deep_merge shares overlay-only subtrees instead of copying them.
+
+        Tests: Copy-free merge of disjoint keys
+        How: Merge overlay subtrees that are new or replace a scalar in base
+        Why: Mostly-disjoint configs should cost O(keys), not O(total nodes)
+        """
+        # Arrange
+        base_db = {"host": "localhost"}
+        base: dict[str, Any] = {"db": base_db, "cache": "off"}
+        overlay = {"db": {"port": 5432}, "cache": {"ttl": 60}, "new": {"k": [1]}}
+
+        # Act
+        result = deep_merge(base, overlay)
+
+        # Assert
+        assert result["db"] is base_db
+        assert result["cache"] is overlay["cache"]
+        assert result["new"] is overlay["new"]
+
+
+class TestMergeInputs:
+    """Test how many yq runs data_merge spends reading its inputs."""
+
+    def test_merge_with_load_when_json_overlay_then_single_yq_run(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test a JSON or TOML base with a JSON overlay merges in one yq run.
+
+        Tests: Single-shot merge via load()
+        How: Record execute_yq calls for a TOML base and JSON overlay
+        Why: The overlay is read by path, never embedded in the expression
+        """
+        # Arrange
+        calls: list[tuple[str, object]] = []
+
+        def _fake_execute_yq(expression: str, **kwargs: object) -> YQResult:
+            calls.append((expression, kwargs["output_format"]))
+            return YQResult(stdout="a = 1\nb = 2\n")
+
+        monkeypatch.setattr(merge_operations, "execute_yq", _fake_execute_yq)
+        overlay = tmp_path / "overlay.json"
+
+        # Act
+        result = merge_with_load(
+            tmp_path / "base.toml",
+            FormatType.TOML,
+            overlay,
+            FormatType.JSON,
+            FormatType.TOML,
+        )
+
+        # Assert
+        assert result is not None
+        assert result.stdout == "a = 1\nb = 2\n"
+        assert calls == [(f'. * load("{overlay.as_posix()}")', FormatType.TOML)]
+
+    def test_merge_with_load_when_yaml_base_then_defers_to_caller(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test a YAML base is not merged through load().
+
+        Tests: In-process fallback selection
+        How: Call merge_with_load with a YAML base and a failing execute_yq
+        Why: A multi-document YAML base would merge the overlay into every document
+        """
+
+        # Arrange
+        def _fail_execute_yq(*_args: object, **_kwargs: object) -> NoReturn:
+            raise AssertionError("execute_yq should not be called")
+
+        monkeypatch.setattr(merge_operations, "execute_yq", _fail_execute_yq)
+
+        # Act
+        result = merge_with_load(
+            tmp_path / "base.yaml",
+            FormatType.YAML,
+            tmp_path / "overlay.json",
+            FormatType.JSON,
+            FormatType.YAML,
+        )
+
+        # Assert
+        assert result is None
+
+    def test_read_merge_inputs_when_called_then_reads_each_file(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test the in-process path reads each file with its own yq run.
+
+        Tests: Per-file read
+        How: Record execute_yq calls for a YAML base and JSON overlay
+        Why: Each file is parsed in its own format before deep_merge
+        """
+        # Arrange
+        calls: list[str] = []
+
+        def _fake_execute_yq(expression: str, **kwargs: object) -> YQResult:
+            calls.append(expression)
+            return YQResult(stdout="", data={"file": str(kwargs["input_file"])})
+
+        monkeypatch.setattr(merge_operations, "execute_yq", _fake_execute_yq)
+        base = tmp_path / "base.yaml"
+        overlay = tmp_path / "overlay.json"
+
+        # Act
+        result = read_merge_inputs(base, FormatType.YAML, overlay, FormatType.JSON)
+
+        # Assert
+        assert result == ({"file": str(base)}, {"file": str(overlay)})
+        assert calls == [".", "."]
+
+
+class TestResolveFilePath:
+    """Test tool-input path resolution."""
+
+    def test_resolve_file_path_when_symlink_then_returns_target(
+        self, tmp_path: Path
+    ) -> None:
+        """Test resolve_file_path returns the real path of an existing file.
+
+        Tests: Strict resolution
+        How: Resolve a symlink pointing at a regular file
+        Why: Responses report the resolved path, as before strict resolution
+        """
+        # Arrange
+        target = tmp_path / "config.json"
+        target.write_text("{}", encoding="utf-8")
+        link = tmp_path / "link.json"
+        link.symlink_to(target)
+
+        # Act
+        result = resolve_file_path(str(link))
+
+        # Assert
+        assert result == target.resolve()
+
+    @pytest.mark.parametrize("relative", ["missing.json", "config.json/child.json"])
+    def test_resolve_file_path_when_missing_then_raises_file_not_found(
+        self, tmp_path: Path, relative: str
+    ) -> None:
+        """Test missing paths, including ones under a file, raise File not found.
+
+        Tests: Strict resolution errors
+        How: Resolve a missing file and a path that treats a file as a directory
+        Why: Both failures must keep the tool's existing error message
+        """
+        # Arrange
+        (tmp_path / "config.json").write_text("{}", encoding="utf-8")
+
+        # Act & Assert
+        with pytest.raises(ToolError, match=_RE_FILE_NOT_FOUND):
+            resolve_file_path(str(tmp_path / relative))
+
+    def test_resolve_file_path_when_symlink_retargeted_then_returns_new_target(
+        self, tmp_path: Path
+    ) -> None:
+        """Test a symlink retargeted between calls resolves to its new target.
+
+        Tests: Resolution freshness
+        How: Resolve a symlink, point it at another file, then resolve it again
+        Why: Edits must land in the file the link names now, not an earlier one
+        """
+        # Arrange
+        first = tmp_path / "first.json"
+        second = tmp_path / "second.json"
+        first.write_text("{}", encoding="utf-8")
+        second.write_text("{}", encoding="utf-8")
+        link = tmp_path / "link.json"
+        link.symlink_to(first)
+        resolve_file_path(str(link))
+        link.unlink()
+        link.symlink_to(second)
+
+        # Act
+        result = resolve_file_path(str(link))
+
+        # Assert
+        assert result == second.resolve()
+
+
+class TestReadFileBytes:
+    """Test the raw-fd file reader used for one-shot config reads."""
+
+    @pytest.mark.parametrize("size_hint", [None, 0, 5, 12])
+    def test_read_file_bytes_when_size_hint_given_then_reads_whole_file(
+        self, tmp_path: Path, size_hint: int | None
+    ) -> None:
+        """Test _read_file_bytes returns full content whatever the size hint.
+
+        Tests: os.read-based whole-file read
+        How: Read with no hint, stale smaller hints, and the exact size
+        Why: A file that grew after its stat must still be read completely
+        """
+        # Arrange
+        content = "key: välue\n".encode()
+        config_file = tmp_path / "config.yaml"
+        config_file.write_bytes(content)
+
+        # Act
+        result = _read_file_bytes(config_file, size_hint)
+
+        # Assert
+        assert result == content
 
 
 class TestPrompts:
@@ -1405,6 +1891,7 @@ class TestEdgeCases:
             # Cleanup - restore permissions so tmp_path can be cleaned
             test_file.chmod(0o644)
 
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_query_when_binary_file_then_handles_gracefully(
         self, tmp_path: Path
     ) -> None:
@@ -1427,6 +1914,7 @@ class TestEdgeCases:
             # ToolError is also acceptable for invalid binary input
             pass
 
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_query_when_json_with_bom_then_handles_gracefully(
         self, tmp_path: Path
     ) -> None:
@@ -1449,6 +1937,7 @@ class TestEdgeCases:
             # ToolError is acceptable -- BOM may cause parse failure
             pass
 
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_query_when_empty_file_then_handles_gracefully(
         self, tmp_path: Path
     ) -> None:
@@ -1497,20 +1986,26 @@ class TestDataMeta:
         assert isinstance(result, ServerInfoResponse)
 
     @pytest.mark.integration
-    def test_data_when_meta_type_then_no_file_resolution(self) -> None:
+    def test_data_when_meta_type_then_no_file_resolution(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test data_type='meta' bypasses file resolution.
 
         Tests: Short-circuit before resolve_file_path
-        How: Patch resolve_file_path to raise, verify meta still succeeds
+        How: Swap resolve_file_path for a function that raises, verify meta still succeeds
         Why: Verify no file I/O occurs for meta requests
         """
-        # Arrange - patch resolve_file_path to fail
-        with unittest.mock.patch(
-            "mcp_json_yaml_toml.tools.data.resolve_file_path",
-            side_effect=AssertionError("should not be called"),
-        ):
-            # Act - request meta (should short-circuit before resolve_file_path)
-            result = data_fn(file_path="-", operation="get", data_type="meta")
+
+        def _fail_resolve(*_args: object, **_kwargs: object) -> NoReturn:
+            raise AssertionError("should not be called")
+
+        # Arrange - swap resolve_file_path for one that fails (plain setattr, no mock)
+        monkeypatch.setattr(
+            "mcp_json_yaml_toml.tools.data.resolve_file_path", _fail_resolve
+        )
+
+        # Act - request meta (should short-circuit before resolve_file_path)
+        result = data_fn(file_path="-", operation="get", data_type="meta")
 
         # Assert - succeeds without touching file resolution
         assert result.success is True
@@ -1535,8 +2030,9 @@ class TestDataMeta:
         assert result2.uptime_seconds > result1.uptime_seconds
 
     @pytest.mark.integration
+    @pytest.mark.usefixtures("pinned_yq_binary")
     def test_data_when_data_type_unchanged_then_still_works(
-        self, sample_json_config: Path
+        self, sample_json_config_str: str
     ) -> None:
         """Test existing data_type='data' operations are unaffected.
 
@@ -1547,7 +2043,7 @@ class TestDataMeta:
         # Arrange - sample JSON config
         # Act - use existing data_type='data' path
         result = data_fn(
-            str(sample_json_config),
+            sample_json_config_str,
             operation="get",
             data_type="data",
             return_type="keys",
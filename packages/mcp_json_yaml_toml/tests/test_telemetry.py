@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
 from typing import TYPE_CHECKING
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 
 from mcp_json_yaml_toml.backends.base import FormatType
-from mcp_json_yaml_toml.telemetry import _TRACER_NAME, get_tracer
+from mcp_json_yaml_toml.telemetry import (
+    _TRACER_NAME,
+    _make_span_processor,
+    configure_telemetry,
+    get_tracer,
+    is_tracing_enabled,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -52,6 +62,67 @@ class TestGetTracer:
         assert attrs["test.key"] == "test_value"
         exporter.clear()
 
+    def test_is_tracing_enabled_when_proxy_or_noop_then_false(self) -> None:
+        """Proxy and no-op tracers discard spans, so tracing counts as disabled."""
+        assert is_tracing_enabled(trace.ProxyTracer(_TRACER_NAME)) is False
+        assert is_tracing_enabled(trace.NoOpTracer()) is False
+
+    def test_is_tracing_enabled_when_sdk_tracer_then_true(self) -> None:
+        """An SDK tracer records spans."""
+        provider, _ = _make_test_provider()
+        assert is_tracing_enabled(provider.get_tracer(_TRACER_NAME)) is True
+
+    def test_import_when_backend_loaded_then_opentelemetry_not_imported(self) -> None:
+        """Importing the yq backend defers loading opentelemetry until first use."""
+        code = (
+            "import sys, mcp_json_yaml_toml.backends.yq; "
+            "print(any(m.startswith('opentelemetry') for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=60,
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestConfigureTelemetry:
+    """Tests for production span processor and provider setup."""
+
+    def test_make_span_processor_when_default_then_batches(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Spans are exported in batches off the request path by default."""
+        monkeypatch.delenv("MCP_JYT_OTEL_SYNC", raising=False)
+
+        processor = _make_span_processor(InMemorySpanExporter())
+
+        assert isinstance(processor, BatchSpanProcessor)
+        processor.shutdown()
+
+    def test_make_span_processor_when_sync_env_set_then_exports_inline(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """MCP_JYT_OTEL_SYNC=1 opts into synchronous span export."""
+        monkeypatch.setenv("MCP_JYT_OTEL_SYNC", "1")
+
+        processor = _make_span_processor(InMemorySpanExporter())
+
+        assert isinstance(processor, SimpleSpanProcessor)
+
+    def test_configure_telemetry_when_no_endpoint_then_skips(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without an OTLP endpoint no provider is installed."""
+        monkeypatch.delenv("OTEL_EXPORTER_OTLP_ENDPOINT", raising=False)
+
+        with patch("opentelemetry.trace.set_tracer_provider") as set_provider:
+            assert configure_telemetry() is False
+        set_provider.assert_not_called()
+
 
 class TestYqExecuteSpan:
     """Tests for custom yq.execute span emission."""
@@ -131,6 +202,29 @@ class TestYqExecuteSpan:
         assert attrs["yq.input_format"] == "yaml"
         exporter.clear()
 
+    def test_execute_yq_when_tracer_is_proxy_then_skips_span(
+        self, tmp_path: Path
+    ) -> None:
+        """execute_yq does not open a span when no SDK provider is installed."""
+        from mcp_json_yaml_toml.backends.yq import execute_yq
+
+        proxy_tracer = MagicMock(spec=trace.ProxyTracer)
+        test_file = tmp_path / "test.json"
+        test_file.write_text(json.dumps({"name": "test"}))
+
+        with patch(
+            "mcp_json_yaml_toml.backends.yq.get_tracer", return_value=proxy_tracer
+        ):
+            result = execute_yq(
+                expression=".name",
+                input_file=str(test_file),
+                input_format=FormatType.JSON,
+                output_format=FormatType.JSON,
+            )
+
+        assert result.data == "test"
+        proxy_tracer.start_as_current_span.assert_not_called()
+
     def test_execute_yq_when_error_then_still_emits_span(
         self, otel_capture: tuple[TracerProvider, InMemorySpanExporter], tmp_path: Path
     ) -> None:
@@ -5,13 +5,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, cast
 
 import pytest
+import tomlkit
 
-from mcp_json_yaml_toml import server
+from mcp_json_yaml_toml import server, toml_utils
+from mcp_json_yaml_toml.toml_utils import delete_toml_key, set_toml_value
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
+
 # FastMCP 3.x: decorators return the original function directly (no .fn needed).
 # At runtime these are callable; cast to satisfy mypy's FunctionTool type.
 data_fn = cast("Callable[..., Any]", server.data)
@@ -93,3 +97,79 @@ username = "admin"
         modified_content = test_file.read_text()
         assert "username" not in modified_content
         assert "host" in modified_content  # Other keys should remain
+
+    def test_toml_set_under_inline_table_creates_inline_tables(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that missing keys below an inline table stay inline."""
+        test_file = tmp_path / "config.toml"
+        test_file.write_text("a = {b = 1}\n")
+
+        result = set_toml_value(test_file, "a.d.e", 3)
+
+        assert result == "a = {b = 1,d = {e = 3}}\n"
+        assert tomlkit.parse(result)["a"] == {"b": 1, "d": {"e": 3}}
+
+
+class TestTOMLDocumentLoading:
+    """Test that each TOML edit starts from a fresh parse of the file."""
+
+    @pytest.mark.unit
+    def test_toml_edits_when_applied_in_sequence_then_match_fresh_parse(
+        self, tmp_path: Path
+    ) -> None:
+        """Each edit's output depends only on the file bytes, not earlier edits."""
+        test_file = tmp_path / "config.toml"
+        test_file.write_text("[tool]\nname='x'\n# c\n[tool.sub]\nk=1\n")
+        edits: list[tuple[str, Any]] = [
+            ("tool.sub2.v", 1),
+            ("tool.name", "y"),
+            ("tool.sub.k2", {"a": 1}),
+            ("tool.sub.k2.b", 2),
+        ]
+
+        for key_path, value in edits:
+            fresh = tomlkit.parse(test_file.read_text())
+            *parents, final_key = key_path.split(".")
+            table: Any = fresh
+            for key in parents:
+                table = table.setdefault(key, tomlkit.table())
+            table[final_key] = value
+
+            content = set_toml_value(test_file, key_path, value)
+
+            assert content == tomlkit.dumps(fresh)
+            test_file.write_text(content)
+
+        fresh = tomlkit.parse(test_file.read_text())
+        del fresh["tool"]["sub"]["k"]
+        assert delete_toml_key(test_file, "tool.sub.k") == tomlkit.dumps(fresh)
+
+    @pytest.mark.unit
+    def test_toml_edit_when_file_changed_externally_then_reparses(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """A file rewritten by someone else is parsed again, not served stale."""
+        test_file = tmp_path / "config.toml"
+        test_file.write_text('[app]\nname = "a"\n')
+        test_file.write_text(set_toml_value(test_file, "app.debug", True))
+        test_file.write_text('[app]\nname = "b"\n')
+        parse_spy = mocker.spy(tomlkit, "parse")
+
+        content = set_toml_value(test_file, "app.port", 1)
+
+        assert parse_spy.call_count == 1
+        assert tomlkit.parse(content) == {"app": {"name": "b", "port": 1}}
+
+    @pytest.mark.unit
+    def test_toml_edit_when_file_above_mmap_threshold_then_reads_mapped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Large files are decoded from a memory map with the same result."""
+        monkeypatch.setattr(toml_utils, "_MMAP_THRESHOLD", 8)
+        test_file = tmp_path / "config.toml"
+        test_file.write_text('[app]\nname = "m\u00fcnchen"  # city\n', encoding="utf-8")
+
+        content = set_toml_value(test_file, "app.port", 8080)
+
+        assert content == '[app]\nname = "m\u00fcnchen"  # city\nport = 8080\n'
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Any, cast
 
 import pytest
@@ -16,6 +17,9 @@ if TYPE_CHECKING:
 # At runtime these are callable; cast to satisfy mypy's FunctionTool type.
 data_fn = cast("Callable[..., Any]", server.data)
 
+# An anchor followed somewhere later by an alias, found in one scan
+_ANCHOR_THEN_ALIAS_RE = re.compile(r"&.*\*", re.DOTALL)
+
 
 class TestYAMLOptimizationIntegration:
     """Test YAML optimization in the data tool."""
@@ -53,8 +57,7 @@ services:
 
         # Read the file and check for anchors
         modified_content = test_file.read_text()
-        assert "&" in modified_content  # Should have anchor
-        assert "*" in modified_content  # Should have alias
+        assert _ANCHOR_THEN_ALIAS_RE.search(modified_content)  # Anchor, then alias
 
     @pytest.mark.integration
     def test_set_operation_preserves_existing_anchors(self, tmp_path: Path) -> None:
@@ -89,8 +92,7 @@ job1:
         modified_content = test_file.read_text()
 
         # Should still have anchors
-        assert "&" in modified_content
-        assert "*" in modified_content
+        assert _ANCHOR_THEN_ALIAS_RE.search(modified_content)
 
     @pytest.mark.integration
     def test_set_operation_no_optimization_for_json(self, tmp_path: Path) -> None:
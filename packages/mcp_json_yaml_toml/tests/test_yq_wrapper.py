@@ -15,6 +15,8 @@ from unittest.mock import Mock
 
 import pytest
 
+from mcp_json_yaml_toml.backends import binary_manager, inprocess, yq as yq_backend
+from mcp_json_yaml_toml.caches import clear_caches
 from mcp_json_yaml_toml.yq_wrapper import (
     DEFAULT_YQ_CHECKSUMS,
     DEFAULT_YQ_VERSION,
@@ -217,6 +219,76 @@ class TestYQResult:
         assert result.returncode == 1
         assert result.data == {"key": "value"}
 
+    @pytest.mark.parametrize(
+        ("stdout", "data", "expected"),
+        [
+            ('{\n  "a": 1e3\n}\n', {"a": 1000.0}, '{\n  "a": 1e3\n}'),
+            ('"x"\n', "x", '"x"'),
+            ('"a"\n"b"\n', ["a", "b"], '[\n  "a",\n  "b"\n]'),
+            ("", None, "null"),
+        ],
+    )
+    def test_yqresult_json_text_when_single_document_then_reuses_stdout(
+        self, stdout: str, data: object, expected: str
+    ) -> None:
+        """Test json_text reuses yq's JSON text except for lists and no data.
+
+        Tests: YQResult.json_text
+        How: Build results for an object, a scalar, a JSON stream, and empty output
+        Why: Re-encoding what yq already serialized is wasted work, but streams
+             must still render as one JSON array
+        """
+        # Arrange
+        result = YQResult(stdout=stdout, data=data)
+
+        # Act
+        text = result.json_text()
+
+        # Assert
+        assert text == expected
+
+    def test_yqresult_output_bytes_when_raw_stdout_kept_then_reuses_it(self) -> None:
+        """Test output_bytes returns the raw stdout bytes without re-encoding.
+
+        Tests: YQResult.output_bytes
+        How: Compare results built with and without stdout_bytes
+        Why: Writing large converted output should not encode it a second time
+        """
+        # Arrange
+        raw = "name: café\n".encode()
+        kept = YQResult(stdout=raw.decode(), stdout_bytes=raw)
+        text_only = YQResult(stdout=raw.decode())
+
+        # Act & Assert
+        assert kept.output_bytes() is raw
+        assert text_only.output_bytes() == raw
+        assert "stdout_bytes" not in kept.model_dump()
+
+    @pytest.mark.parametrize(
+        ("stdout", "expected"),
+        [
+            (b'{"name": "caf\xc3\xa9"}\n', {"name": "café"}),
+            (b"1\n2\n", [1, 2]),
+            (b"  \n", None),
+            (b"", None),
+        ],
+    )
+    def test_parse_json_output_when_raw_bytes_then_parses_without_decoding(
+        self, stdout: bytes, expected: object
+    ) -> None:
+        """Test yq's JSON output parses straight from the subprocess bytes.
+
+        Tests: _parse_json_output on bytes
+        How: Parse a document, a JSON stream, whitespace, and empty output
+        Why: _execute_command hands over raw stdout to skip a re-encode
+        """
+        # Act
+        data, stderr = yq_backend._parse_json_output(stdout, "", FormatType.JSON)
+
+        # Assert
+        assert data == expected
+        assert stderr == ""
+
 
 class TestExecuteYQ:
     """Test execute_yq function."""
@@ -422,6 +494,329 @@ class TestExecuteYQ:
         assert isinstance(result.data, dict)
         assert result.data["name"] == "test-app"
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            (".", {"users": [{"name": "a"}, {"name": "b"}], "count": 2}),
+            (".count", 2),
+            (".users[1].name", "b"),
+            (".users[5]", None),
+            (".missing.deeper", None),
+        ],
+    )
+    def test_execute_yq_when_inprocess_simple_path_then_skips_subprocess(
+        self,
+        mocker: MockerFixture,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        expression: str,
+        expected: object,
+    ) -> None:
+        """Test the opt-in in-process backend answers simple JSON paths.
+
+        Tests: MCP_JYT_YQ_BACKEND=inprocess fast path
+        How: Query plain paths on a JSON file with subprocess.run forbidden
+        Why: Simple lookups must not pay for a yq fork, and must match yq output
+        """
+        # Arrange
+        monkeypatch.setenv("MCP_JYT_YQ_BACKEND", "inprocess")
+        mock_run = mocker.patch("subprocess.run", side_effect=AssertionError)
+        json_file = tmp_path / "data.json"
+        json_file.write_text(
+            '{"users": [{"name": "a"}, {"name": "b"}], "count": 2}', encoding="utf-8"
+        )
+
+        # Act
+        result = execute_yq(
+            expression,
+            input_file=json_file,
+            input_format=FormatType.JSON,
+            output_format=FormatType.JSON,
+        )
+
+        # Assert
+        mock_run.assert_not_called()
+        assert result.returncode == 0
+        assert result.data == expected
+        assert result.stdout.endswith("\n")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("expression", "input_format"),
+        [
+            (".items | length", FormatType.JSON),
+            (".name", FormatType.YAML),
+            (".name.first", FormatType.JSON),
+        ],
+    )
+    def test_execute_yq_when_inprocess_unsupported_then_falls_back_to_yq(
+        self,
+        mocker: MockerFixture,
+        monkeypatch: pytest.MonkeyPatch,
+        expression: str,
+        input_format: FormatType,
+    ) -> None:
+        """Test the in-process backend defers anything beyond plain JSON paths.
+
+        Tests: Fallback to the yq subprocess
+        How: Run a pipeline, a YAML input, and a scalar lookup with subprocess mocked
+        Why: yq semantics stay authoritative for expressions Python does not model
+        """
+        # Arrange
+        monkeypatch.setenv("MCP_JYT_YQ_BACKEND", "inprocess")
+        mock_result = Mock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"3"
+        mock_result.stderr = b""
+        mock_run = mocker.patch("subprocess.run", return_value=mock_result)
+
+        # Act
+        result = execute_yq(
+            expression,
+            input_data='{"name": "x", "items": [1, 2, 3]}',
+            input_format=input_format,
+            output_format=FormatType.JSON,
+        )
+
+        # Assert
+        assert mock_run.called
+        assert result.data == 3
+
+    @pytest.mark.unit
+    def test_execute_yq_when_unchanged_file_queried_twice_then_evaluates_once(
+        self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test repeat read-only queries on an unchanged file are served from cache.
+
+        Tests: execute_yq result cache
+        How: Query an old file twice, mutate the first result, then rewrite the file
+        Why: Repeat queries must skip evaluation without leaking mutations or stale data
+        """
+        # Arrange
+        monkeypatch.setenv("MCP_JYT_YQ_BACKEND", "inprocess")
+        spy = mocker.spy(yq_backend, "_evaluate")
+        json_file = tmp_path / "data.json"
+        json_file.write_text('{"items": [1, 2]}', encoding="utf-8")
+        os.utime(json_file, ns=(1_000_000_000, 1_000_000_000))
+
+        # Act
+        first = execute_yq(".", input_file=json_file, input_format=FormatType.JSON)
+        first.data["items"].append(3)
+        second = execute_yq(".", input_file=json_file, input_format=FormatType.JSON)
+        json_file.write_text('{"items": [9, 9]}', encoding="utf-8")
+        os.utime(json_file, ns=(2_000_000_000, 2_000_000_000))
+        third = execute_yq(".", input_file=json_file, input_format=FormatType.JSON)
+
+        # Assert
+        assert spy.call_count == 2
+        assert second.data == {"items": [1, 2]}
+        assert third.data == {"items": [9, 9]}
+
+    @pytest.mark.unit
+    def test_evaluate_identity_when_unchanged_json_file_then_parses_once(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test the identity fast path reuses its parse until the file changes.
+
+        Tests: evaluate_identity parse cache
+        How: Read an old JSON file twice, rewrite it, then read it again
+        Why: data_query on "." must skip both yq and repeat parses of unchanged files
+        """
+        # Arrange
+        spy = mocker.spy(inprocess, "evaluate_simple_path")
+        json_file = tmp_path / "data.json"
+        json_file.write_text('{"items": [1, 2]}', encoding="utf-8")
+        os.utime(json_file, ns=(1_000_000_000, 1_000_000_000))
+
+        # Act
+        first = inprocess.evaluate_identity(json_file)
+        second = inprocess.evaluate_identity(json_file)
+        json_file.write_text('{"items": [9]}', encoding="utf-8")
+        third = inprocess.evaluate_identity(json_file)
+
+        # Assert
+        assert first is not None
+        assert second is first
+        assert third is not None
+        assert third.data == {"items": [9]}
+        assert spy.call_count == 2
+
+    @pytest.mark.unit
+    def test_evaluate_identity_when_file_atomically_replaced_then_reparses(
+        self, tmp_path: Path
+    ) -> None:
+        """Test a same-size, same-mtime replacement is not served from cache.
+
+        Tests: Inode in the stat cache signature
+        How: Rename a new file with equal size and mtime over a cached one
+        Why: Write-then-rename saves can land within one timestamp tick
+        """
+        # Arrange
+        json_file = tmp_path / "data.json"
+        json_file.write_text('{"v": 1}', encoding="utf-8")
+        os.utime(json_file, ns=(1_000_000_000, 1_000_000_000))
+        first = inprocess.evaluate_identity(json_file)
+        replacement = tmp_path / "data.json.tmp"
+        replacement.write_text('{"v": 2}', encoding="utf-8")
+        os.utime(replacement, ns=(1_000_000_000, 1_000_000_000))
+
+        # Act
+        replacement.replace(json_file)
+        second = inprocess.evaluate_identity(json_file)
+
+        # Assert
+        assert first is not None
+        assert first.data == {"v": 1}
+        assert second is not None
+        assert second.data == {"v": 2}
+
+    @pytest.mark.unit
+    def test_evaluate_simple_path_when_large_json_file_then_parses_mapped_file(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test files above the mmap threshold parse the same as small ones.
+
+        Tests: Memory-mapped JSON file parse
+        How: Lower the threshold below the file size and evaluate a path
+        Why: Large files are parsed from the page cache without a heap copy
+        """
+        # Arrange
+        monkeypatch.setattr(inprocess, "_MMAP_THRESHOLD", 8)
+        json_file = tmp_path / "data.json"
+        json_file.write_text('{"items": [1, 2], "name": "café"}', encoding="utf-8")
+
+        # Act
+        result = inprocess.evaluate_simple_path(
+            ".name", None, json_file, FormatType.JSON, FormatType.JSON
+        )
+
+        # Assert
+        assert result is not None
+        assert result.data == "café"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("input_data", ['{"a": 1}', b'{"a": 1}'])
+    def test_run_yq_subprocess_when_input_data_then_pipes_utf8_bytes(
+        self, mocker: MockerFixture, input_data: str | bytes
+    ) -> None:
+        """Test stdin data reaches yq as UTF-8 bytes for str and bytes input.
+
+        Tests: _run_yq_subprocess stdin handling
+        How: Pass the same document as str and as bytes with subprocess mocked
+        Why: Callers holding serialized bytes must not pay a decode/encode round trip
+        """
+        # Arrange
+        mock_run = mocker.patch("subprocess.run", return_value=Mock())
+
+        # Act
+        yq_backend._run_yq_subprocess(["yq", "."], input_data)
+
+        # Assert
+        assert mock_run.call_args.kwargs["input"] == b'{"a": 1}'
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "expression", ['. * load("other.json")', ".a = env(HOME)", ".t = now"]
+    )
+    def test_execute_yq_when_expression_reads_external_input_then_not_cached(
+        self, mocker: MockerFixture, tmp_path: Path, expression: str
+    ) -> None:
+        """Test expressions depending on more than the input file bypass the cache.
+
+        Tests: execute_yq result cache exclusions
+        How: Run load/env/now expressions twice on an old file with evaluation mocked
+        Why: Another file, the environment, or the clock can change under a cached key
+        """
+        # Arrange
+        evaluate = mocker.patch.object(
+            yq_backend, "_evaluate", return_value=YQResult(stdout="{}\n", data={})
+        )
+        json_file = tmp_path / "data.json"
+        json_file.write_text("{}", encoding="utf-8")
+        os.utime(json_file, ns=(1_000_000_000, 1_000_000_000))
+
+        # Act
+        for _ in range(2):
+            execute_yq(expression, input_file=json_file, input_format=FormatType.JSON)
+
+        # Assert
+        assert evaluate.call_count == 2
+
+    @pytest.mark.unit
+    def test_execute_yq_when_file_just_modified_then_not_cached(
+        self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test files modified within the timestamp window bypass the result cache.
+
+        Tests: execute_yq result cache freshness guard
+        How: Query a freshly written file twice
+        Why: Coarse mtimes cannot distinguish same-size rewrites within one tick
+        """
+        # Arrange
+        monkeypatch.setenv("MCP_JYT_YQ_BACKEND", "inprocess")
+        spy = mocker.spy(yq_backend, "_evaluate")
+        json_file = tmp_path / "data.json"
+        json_file.write_text('{"a": 1}', encoding="utf-8")
+
+        # Act
+        execute_yq(".a", input_file=json_file, input_format=FormatType.JSON)
+        execute_yq(".a", input_file=json_file, input_format=FormatType.JSON)
+
+        # Assert
+        assert spy.call_count == 2
+
+    @pytest.mark.unit
+    def test_execute_yq_when_cache_full_then_evicts_least_recently_used(
+        self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test the result cache evicts the least recently used entry when full.
+
+        Tests: execute_yq result cache eviction
+        How: Fill a two-entry cache, reuse the first query, then add a third
+        Why: Hot queries should survive eviction ahead of ones not repeated
+        """
+        # Arrange
+        monkeypatch.setenv("MCP_JYT_YQ_BACKEND", "inprocess")
+        monkeypatch.setattr(yq_backend, "_RESULT_CACHE_MAXSIZE", 2)
+        spy = mocker.spy(yq_backend, "_evaluate")
+        json_file = tmp_path / "data.json"
+        json_file.write_text('{"a": 1, "b": 2, "c": 3}', encoding="utf-8")
+        os.utime(json_file, ns=(1_000_000_000, 1_000_000_000))
+
+        # Act
+        for expression in (".a", ".b", ".a", ".c", ".a", ".b"):
+            execute_yq(expression, input_file=json_file, input_format=FormatType.JSON)
+
+        # Assert
+        evaluated = [call.args[0] for call in spy.call_args_list]
+        assert evaluated == [".a", ".b", ".c", ".b"]
+
+    @pytest.mark.unit
+    def test_clear_caches_when_called_then_next_query_reevaluates(
+        self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test clear_caches drops cached yq results.
+
+        Tests: Package-wide cache reset
+        How: Query an old file, clear caches, then query it again
+        Why: Callers needing a cold start must not reach into private caches
+        """
+        # Arrange
+        monkeypatch.setenv("MCP_JYT_YQ_BACKEND", "inprocess")
+        spy = mocker.spy(yq_backend, "_evaluate")
+        json_file = tmp_path / "data.json"
+        json_file.write_text('{"a": 1}', encoding="utf-8")
+        os.utime(json_file, ns=(1_000_000_000, 1_000_000_000))
+        execute_yq(".a", input_file=json_file, input_format=FormatType.JSON)
+
+        # Act
+        clear_caches()
+        execute_yq(".a", input_file=json_file, input_format=FormatType.JSON)
+
+        # Assert
+        assert spy.call_count == 2
+
 
 class TestValidateYQBinary:
     """Test validate_yq_binary function."""
@@ -633,6 +1028,66 @@ class TestYQBinaryPathOverride:
         assert result.exists()
 
 
+class TestStorageLocation:
+    """Tests for _get_storage_location probing."""
+
+    def test_get_storage_location_when_called_twice_then_probes_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the writability probe is not repeated per lookup.
+
+        Tests: Storage location memoization
+        How: Count Path.touch calls across two lookups for the same home
+        Why: Every yq call resolves the binary, which consults this location
+        """
+        # Arrange
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        touches: list[Path] = []
+        original_touch = Path.touch
+
+        def counting_touch(self: Path, *args: object, **kwargs: object) -> None:
+            touches.append(self)
+            original_touch(self, *args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(Path, "touch", counting_touch)
+
+        # Act
+        first = binary_manager._get_storage_location()
+        second = binary_manager._get_storage_location()
+
+        # Assert
+        assert first == second == tmp_path / ".local" / "bin"
+        assert len(touches) == 1
+
+
+class TestBuildYqCommand:
+    """Tests for _build_yq_command argument assembly."""
+
+    def test_build_yq_command_when_prefix_reused_then_appends_call_arguments(
+        self,
+    ) -> None:
+        """Test that cached argv prefixes do not leak per-call arguments.
+
+        Tests: Argument prefix reuse
+        How: Build two commands sharing binary and formats, differing in expression and file
+        Why: The cached prefix must stay immutable across calls
+        """
+        # Arrange
+        binary = Path("/opt/yq")
+
+        # Act
+        first = yq_backend._build_yq_command(
+            binary, ".a", "one.json", FormatType.JSON, FormatType.YAML, False, False
+        )
+        second = yq_backend._build_yq_command(
+            binary, ".b", None, FormatType.JSON, FormatType.YAML, False, False
+        )
+
+        # Assert
+        assert first == [str(binary), "-p", "json", "-o", "yaml", ".a", "one.json"]
+        assert second == [str(binary), "-p", "json", "-o", "yaml", ".b"]
+
+
 class TestIsMikefarahYQ:
     """Tests for _is_mikefarah_yq detection function."""
 
@@ -745,6 +1200,33 @@ class TestIsMikefarahYQ:
         # Assert
         assert result is False
 
+    def test_is_mikefarah_yq_when_binary_unchanged_then_probes_once(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test that version probes are cached per binary file identity.
+
+        Tests: Version probe caching
+        How: Check the same on-disk binary twice, then rewrite it and check again
+        Why: Resolving system yq must not fork ``yq --version`` on every query
+        """
+        # Arrange
+        mock_result = Mock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"yq (https://github.com/mikefarah/yq/) version v4.52.2"
+        run_mock = mocker.patch("subprocess.run", return_value=mock_result)
+        fake_binary = tmp_path / "yq"
+        fake_binary.write_bytes(b"binary-v1")
+
+        # Act
+        first = _is_mikefarah_yq(fake_binary)
+        second = _is_mikefarah_yq(fake_binary)
+        fake_binary.write_bytes(b"binary-v2-longer")
+        third = _is_mikefarah_yq(fake_binary)
+
+        # Assert
+        assert first is second is third is True
+        assert run_mock.call_count == 2
+
 
 class TestVersionParsing:
     """Tests for version parsing and comparison functions."""
@@ -18,6 +18,11 @@ if TYPE_CHECKING:
 # FastMCP 3.x: decorators return the original function directly.
 _data_query = cast("Callable[..., DataResponse]", data_query)
 
+# Resolved once from this file, so the check works from any working directory
+GITHUB_TEST_WORKFLOW = (
+    Path(__file__).resolve().parents[3] / ".github" / "workflows" / "test.yml"
+)
+
 
 def test_hints() -> None:
     """Test pagination hints with a large file query.
@@ -25,8 +30,7 @@ def test_hints() -> None:
     Verifies that data_query returns a properly structured DataResponse,
     and validates pagination fields when the response is paginated.
     """
-    github_test_yml = Path(".github/workflows/test.yml")
-    result = _data_query(str(github_test_yml), ".", output_format="json")
+    result = _data_query(str(GITHUB_TEST_WORKFLOW), ".", output_format="json")
 
     assert isinstance(result, DataResponse)
     assert result.success is True
@@ -6,14 +6,58 @@ tomlkit preserves comments and formatting, consistent with our ruamel.yaml appro
 
 from __future__ import annotations
 
+import functools
+import mmap
+import os
+import sys
 from collections.abc import MutableMapping
 from typing import TYPE_CHECKING, Any
 
 import tomlkit
+from tomlkit.items import InlineTable
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from tomlkit import TOMLDocument
+
+# Files larger than this are decoded straight from a read-only memory map,
+# so no bytes copy of the file is held alongside the text
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _load_document(file_path: Path) -> TOMLDocument:
+    """Parse a TOML file from its raw bytes.
+
+    Every call parses afresh: a document that has been edited does not
+    round-trip to the same trivia as ``tomlkit.parse`` of its own output, so
+    reusing one would make an edit's result depend on earlier edits.
+
+    Args:
+        file_path: Path to TOML file
+
+    Returns:
+        ``tomlkit.parse`` of the current file content
+    """
+    with file_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return tomlkit.parse(str(mapped, "utf-8"))
+        # One UTF-8 decode of the buffer, without text-mode I/O
+        return tomlkit.parse(str(f.read(), "utf-8"))
+
+
+@functools.lru_cache(maxsize=512)
+def _split_key_path(key_path: str) -> tuple[tuple[str, ...], str]:
+    """Split a dot-separated key path into interned parent segments and final key.
+
+    Servers tend to edit the same few key paths repeatedly, so the split is
+    cached already divided the way navigation consumes it; interned segments
+    compare by identity against equal dict keys.
+    """
+    *intermediate, final_key = (sys.intern(part) for part in key_path.split("."))
+    return tuple(intermediate), final_key
+
 
 def _navigate_to_parent(
     data: MutableMapping[str, Any], key_path: str, *, create_missing: bool = False
@@ -33,20 +77,26 @@ def _navigate_to_parent(
         KeyError: If an intermediate key is missing and create_missing is False.
         TypeError: If an intermediate value is not a mapping (e.g., navigating through a string).
     """
-    keys = key_path.split(".")
+    intermediate, final_key = _split_key_path(key_path)
     current: MutableMapping[str, Any] = data
-    for key in keys[:-1]:
-        if key not in current:
-            if create_missing:
-                current[key] = {}
-            else:
+    for key in intermediate:
+        # One lookup per level; TOML has no null, so None always means missing
+        nested = current.get(key)
+        if nested is None:
+            if not create_missing:
                 raise KeyError(f"Key path '{key_path}' not found")
-        nested = current[key]
+            # An inline table can only hold inline tables
+            current[key] = (
+                tomlkit.inline_table()
+                if isinstance(current, InlineTable)
+                else tomlkit.table()
+            )
+            nested = current[key]
         if not isinstance(nested, MutableMapping):
             msg = f"Cannot navigate through non-table value at key '{key}'"
             raise TypeError(msg)
         current = nested
-    return current, keys[-1]
+    return current, final_key
 
 
 def set_toml_value(file_path: Path, key_path: str, value: Any) -> str:
@@ -60,8 +110,7 @@ def set_toml_value(file_path: Path, key_path: str, value: Any) -> str:
     Returns:
         Modified TOML content as string (preserves comments and formatting)
     """
-    content = file_path.read_text(encoding="utf-8")
-    data = tomlkit.parse(content)
+    data = _load_document(file_path)
     parent, final_key = _navigate_to_parent(data, key_path, create_missing=True)
     parent[final_key] = value
     return tomlkit.dumps(data)
@@ -77,8 +126,7 @@ def delete_toml_key(file_path: Path, key_path: str) -> str:
     Returns:
         Modified TOML content as string (preserves comments and formatting)
     """
-    content = file_path.read_text(encoding="utf-8")
-    data = tomlkit.parse(content)
+    data = _load_document(file_path)
     parent, final_key = _navigate_to_parent(data, key_path, create_missing=False)
     if final_key not in parent:
         raise KeyError(f"Key path '{key_path}' not found")
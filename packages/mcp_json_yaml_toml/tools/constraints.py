@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import Annotated, Any
 
 from fastmcp.exceptions import ToolError
@@ -9,6 +10,7 @@ from pydantic import Field
 
 from mcp_json_yaml_toml.lmql_constraints import (
     ConstraintRegistry,
+    ValidationResult,
     get_constraint_hint,
     validate_tool_input,
 )
@@ -18,6 +20,25 @@ from mcp_json_yaml_toml.models.responses import (
 )
 from mcp_json_yaml_toml.server import mcp
 
+_CONSTRAINTS_DESCRIPTION = "LMQL-style constraints for validating tool inputs"
+_CONSTRAINTS_USAGE = (
+    "Use these constraints with LMQL or similar tools for constrained generation"
+)
+_CONSTRAINT_LIST_USAGE = (
+    "Use constraint_validate(constraint_name, value) to validate inputs. "
+    "Access constraint definitions via lmql://constraints/{name} resource."
+)
+
+# Fields ConstraintValidateResponse declares; anything else goes to extras
+_KNOWN_VALIDATE_FIELDS = frozenset(ConstraintValidateResponse.model_fields)
+
+# ValidationResult fields without a declared response field
+_VALIDATION_EXTRA_FIELDS = tuple(
+    f.name
+    for f in dataclasses.fields(ValidationResult)
+    if f.name not in _KNOWN_VALIDATE_FIELDS
+)
+
 # ---------------------------------------------------------------------------
 # Resources
 # ---------------------------------------------------------------------------
@@ -35,8 +56,8 @@ def list_all_constraints() -> dict[str, Any]:
     """
     return {
         "constraints": ConstraintRegistry.get_all_definitions(),
-        "description": "LMQL-style constraints for validating tool inputs",
-        "usage": "Use these constraints with LMQL or similar tools for constrained generation",
+        "description": _CONSTRAINTS_DESCRIPTION,
+        "usage": _CONSTRAINTS_USAGE,
     }
 
 
@@ -109,10 +130,13 @@ def constraint_validate(
         hint_value = get_constraint_hint(constraint_name, value)
 
     # Collect dynamic extras (suggestions, remaining_pattern) for
-    # Pydantic's extra="allow" bucket -- exclude known model fields.
-    result_dict = result.to_dict()
-    known_fields = ConstraintValidateResponse.model_fields
-    extras = {k: v for k, v in result_dict.items() if k not in known_fields}
+    # Pydantic's extra="allow" bucket -- read straight off the result,
+    # omitting empty values as ValidationResult.to_dict() does.
+    extras = {
+        name: extra
+        for name in _VALIDATION_EXTRA_FIELDS
+        if (extra := getattr(result, name))
+    }
 
     return ConstraintValidateResponse(
         valid=result.valid,
@@ -142,13 +166,9 @@ def constraint_list() -> ConstraintListResponse:
             - "constraints": a list of constraint objects; each object includes a "name" key and the constraint's definition fields (e.g., "description", any other metadata).
             - "usage": a string describing how to validate a value against a constraint (e.g., call `constraint_validate(constraint_name, value)`).
     """
-    definitions = ConstraintRegistry.get_all_definitions()
     return ConstraintListResponse(
-        constraints=[{"name": name, **defn} for name, defn in definitions.items()],
-        usage=(
-            "Use constraint_validate(constraint_name, value) to validate inputs. "
-            "Access constraint definitions via lmql://constraints/{name} resource."
-        ),
+        constraints=ConstraintRegistry.get_definition_list(),
+        usage=_CONSTRAINT_LIST_USAGE,
     )
 
 
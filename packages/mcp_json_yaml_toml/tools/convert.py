@@ -9,12 +9,36 @@ import orjson
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
-from mcp_json_yaml_toml.backends.base import FormatType, YQExecutionError
+from mcp_json_yaml_toml.backends.base import FormatType, YQExecutionError, YQResult
 from mcp_json_yaml_toml.backends.yq import execute_yq
 from mcp_json_yaml_toml.config import require_format_enabled, validate_format
-from mcp_json_yaml_toml.formats.base import _detect_file_format, resolve_file_path
+from mcp_json_yaml_toml.formats.base import (
+    _detect_file_format,
+    resolve_file_path,
+    resolve_input_file,
+)
 from mcp_json_yaml_toml.models.responses import ConvertResponse, MergeResponse
 from mcp_json_yaml_toml.server import mcp
+from mcp_json_yaml_toml.services.merge_operations import (
+    deep_merge,
+    merge_with_load,
+    read_merge_inputs,
+)
+
+# The tools' Literal output_format values; anything else goes through validate_format
+_FORMAT_MAP: dict[str, FormatType] = {
+    "json": FormatType.JSON,
+    "yaml": FormatType.YAML,
+    "toml": FormatType.TOML,
+}
+
+# Input formats data_convert refuses to convert to TOML
+_TOML_UNSUPPORTED_INPUTS = frozenset({FormatType.JSON, FormatType.YAML})
+
+
+def _output_format(name: str) -> FormatType:
+    """Map an output format name to FormatType with a single dict probe."""
+    return _FORMAT_MAP.get(name) or validate_format(name)
 
 
 @mcp.tool(
@@ -54,17 +78,14 @@ def data_convert(
     require_format_enabled(input_format)
 
     # Validate output format
-    output_fmt: FormatType = validate_format(output_format)
+    output_fmt = _output_format(output_format)
 
     if input_format == output_fmt:
         raise ToolError(f"Input and output formats are the same: {input_format}")
 
     # JSON/YAML to TOML conversion is not supported due to yq limitations
     # yq's TOML encoder only supports scalar values, not complex nested structures
-    if output_fmt == FormatType.TOML and input_format in {
-        FormatType.JSON,
-        FormatType.YAML,
-    }:
+    if output_fmt == FormatType.TOML and input_format in _TOML_UNSUPPORTED_INPUTS:
         raise ToolError(
             f"Conversion from {input_format.upper()} to TOML is not supported. "
             "The underlying yq tool cannot encode complex nested structures to TOML format. "
@@ -80,7 +101,7 @@ def data_convert(
         # Write to file if requested
         if output_file:
             out_path = Path(output_file).expanduser().resolve()
-            out_path.write_text(result.stdout, encoding="utf-8")
+            out_path.write_bytes(result.output_bytes())
             return ConvertResponse(
                 success=True,
                 input_file=str(path),
@@ -141,10 +162,10 @@ def data_merge(
         and either "result" (merged content) or "output_file" (written path).
 
     Raises:
-        ToolError: If an input file is missing, its format is not enabled, the output format is invalid, or the merge fails.
+        ToolError: If an input file is missing or not a regular file, its format is not enabled, the output format is invalid, or the merge fails.
     """
-    path1 = resolve_file_path(file_path1)
-    path2 = resolve_file_path(file_path2)
+    path1 = resolve_input_file(file_path1)
+    path2 = resolve_input_file(file_path2)
 
     # Detect formats
     format1 = _detect_file_format(path1)
@@ -154,35 +175,33 @@ def data_merge(
     require_format_enabled(format2)
 
     # Determine output format
-    output_fmt = validate_format(output_format or format1.value)
+    output_fmt = format1 if output_format is None else _output_format(output_format)
 
     try:
-        # Read both files into JSON for merging
-        result1 = execute_yq(
-            ".", input_file=path1, input_format=format1, output_format=FormatType.JSON
-        )
-        result2 = execute_yq(
-            ".", input_file=path2, input_format=format2, output_format=FormatType.JSON
-        )
-
-        # Merge using yq's multiply operator (*)
-        # This does a deep merge
-        merged_json = orjson.dumps(result1.data).decode() if result1.data else "{}"
-        overlay_json = orjson.dumps(result2.data).decode() if result2.data else "{}"
-
-        # Use yq to merge
-        merge_expression = f". * {overlay_json}"
-        merge_result = execute_yq(
-            merge_expression,
-            input_data=merged_json,
-            input_format=FormatType.JSON,
-            output_format=output_fmt,
-        )
+        result = merge_with_load(path1, format1, path2, format2, output_fmt)
+        if result is None:
+            # Parse both files, then deep merge in-process with yq's * semantics
+            base, overlay = read_merge_inputs(path1, format1, path2, format2)
+            merged = deep_merge(base or {}, overlay or {})
+
+            if output_fmt == FormatType.JSON:
+                # orjson matches yq's 2-space JSON layout, so skip the render pass
+                output = orjson.dumps(
+                    merged, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                )
+                result = YQResult(stdout=output.decode(), stdout_bytes=output)
+            else:
+                result = execute_yq(
+                    ".",
+                    input_data=orjson.dumps(merged),
+                    input_format=FormatType.JSON,
+                    output_format=output_fmt,
+                )
 
         # Write to file if requested
         if output_file:
             out_path = Path(output_file).expanduser().resolve()
-            out_path.write_text(merge_result.stdout, encoding="utf-8")
+            out_path.write_bytes(result.output_bytes())
             return MergeResponse(
                 success=True,
                 file1=str(path1),
@@ -196,7 +215,7 @@ def data_merge(
             file1=str(path1),
             file2=str(path2),
             output_format=output_fmt,
-            result=merge_result.stdout,
+            result=result.stdout,
         )
 
     except YQExecutionError as e:
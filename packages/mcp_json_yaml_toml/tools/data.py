@@ -18,6 +18,7 @@ from mcp_json_yaml_toml.services.data_operations import (
     _dispatch_delete_operation,
     _dispatch_get_operation,
     _dispatch_set_operation,
+    _handle_meta_get,
 )
 
 
@@ -92,10 +93,6 @@ def data(
     - delete: Remove key/element at key_path (always writes to file)
     """
     if data_type == "meta":
-        from mcp_json_yaml_toml.services.get_operations import (  # noqa: PLC0415
-            _handle_meta_get,
-        )
-
         return _handle_meta_get()
 
     path = resolve_file_path(file_path)
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Annotated, Any
 
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
 from mcp_json_yaml_toml.backends.base import FormatType, YQExecutionError
+from mcp_json_yaml_toml.backends.inprocess import evaluate_identity
 from mcp_json_yaml_toml.backends.yq import execute_yq
 from mcp_json_yaml_toml.config import require_format_enabled
-from mcp_json_yaml_toml.formats.base import _detect_file_format, resolve_file_path
+from mcp_json_yaml_toml.formats.base import (
+    _detect_file_format,
+    _read_file_bytes,
+    resolve_file_path,
+)
 from mcp_json_yaml_toml.models.responses import DiffResponse
 from mcp_json_yaml_toml.server import mcp
 from mcp_json_yaml_toml.services.diff_operations import (
@@ -19,6 +25,104 @@ from mcp_json_yaml_toml.services.diff_operations import (
     compute_diff,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Runs the second file's parse while the calling thread parses the first;
+# yq runs as a subprocess, so the two parses overlap without holding the GIL
+_PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="data-diff")
+
+
+def _parse_file(path: Path, file_format: FormatType) -> Any:
+    """Parse a file to plain data for diffing.
+
+    JSON is parsed in-process, since its identity needs no yq run. YAML and
+    TOML go through yq, which stays the reference for how their dates, tags
+    and merge keys map to JSON, so cross-format diffs compare like values.
+
+    Args:
+        path: File to parse
+        file_format: Detected format of the file
+
+    Returns:
+        Parsed data; shared with the identity cache for JSON, so read-only
+
+    Raises:
+        YQExecutionError: If yq fails to parse the file
+    """
+    if file_format == FormatType.JSON:
+        identity = evaluate_identity(path)
+        if identity is not None:
+            return identity.data
+    return execute_yq(
+        ".", input_file=path, input_format=file_format, output_format=FormatType.JSON
+    ).data
+
+
+def _parse_pair(
+    path1: Path, format1: FormatType, path2: Path, format2: FormatType
+) -> tuple[Any, Any]:
+    """Parse both diff inputs, overlapping the parses when yq is involved.
+
+    Args:
+        path1: First (base) file
+        format1: Format of the first file
+        path2: Second (comparison) file
+        format2: Format of the second file
+
+    Returns:
+        Tuple of (data1, data2)
+
+    Raises:
+        YQExecutionError: If yq fails to parse either file
+    """
+    if format1 == format2 == FormatType.JSON:
+        # Both parse in-process; a thread hop would only add overhead
+        return _parse_file(path1, format1), _parse_file(path2, format2)
+    future2 = _PARSE_EXECUTOR.submit(_parse_file, path2, format2)
+    return _parse_file(path1, format1), future2.result()
+
+
+def _same_bytes(path1: Path, path2: Path) -> bool:
+    """Return True if two files hold identical bytes.
+
+    Sizes are compared first, so files of different lengths are never read.
+    Both files are read afresh on every call; filecmp's process-wide cache
+    is keyed on mtime and can miss a same-size edit within one timestamp tick.
+    """
+    try:
+        size = path1.stat().st_size
+        if path2.stat().st_size != size:
+            return False
+        return _read_file_bytes(path1, size) == _read_file_bytes(path2, size)
+    except OSError:
+        # Let the parse report the unreadable file
+        return False
+
+
+def _diff_files(
+    path1: Path,
+    format1: FormatType,
+    path2: Path,
+    format2: FormatType,
+    *,
+    ignore_order: bool,
+) -> dict[str, Any]:
+    """Diff two files, parsing only one of them when their bytes are identical.
+
+    Same-format files with identical content cannot differ, so one parse
+    stands in for two parses and a tree walk on the common unchanged-file
+    path. That parse still reports a syntax error, as for differing files.
+
+    Raises:
+        YQExecutionError: If yq fails to parse either file
+    """
+    if format1 == format2 and _same_bytes(path1, path2):
+        _parse_file(path1, format1)
+        return {}
+    data1, data2 = _parse_pair(path1, format1, path2, format2)
+    return compute_diff(data1, data2, ignore_order=ignore_order)
+
 
 @mcp.tool(
     timeout=60.0,
@@ -58,19 +162,9 @@ def data_diff(
     require_format_enabled(format2)
 
     try:
-        # Parse both files to Python dicts via yq -> JSON pipeline
-        result1 = execute_yq(
-            ".", input_file=path1, input_format=format1, output_format=FormatType.JSON
-        )
-        result2 = execute_yq(
-            ".", input_file=path2, input_format=format2, output_format=FormatType.JSON
+        diff_dict = _diff_files(
+            path1, format1, path2, format2, ignore_order=ignore_order
         )
-
-        data1 = result1.data
-        data2 = result2.data
-
-        # Compute diff
-        diff_dict = compute_diff(data1, data2, ignore_order=ignore_order)
         has_differences = bool(diff_dict)
 
         # Build statistics and summary
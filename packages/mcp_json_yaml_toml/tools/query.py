@@ -8,6 +8,7 @@ from fastmcp.exceptions import ToolError
 from pydantic import Field
 
 from mcp_json_yaml_toml.backends.base import FormatType, YQExecutionError
+from mcp_json_yaml_toml.backends.inprocess import evaluate_identity
 from mcp_json_yaml_toml.backends.yq import execute_yq
 from mcp_json_yaml_toml.config import require_format_enabled, validate_format
 from mcp_json_yaml_toml.formats.base import (
@@ -83,6 +84,13 @@ def data_query(
     output_format_value: FormatType = (
         input_format if output_format is None else validate_format(output_format)
     )
+
+    # The whole of a JSON file as JSON needs no yq run
+    if expression == "." and input_format == output_format_value == FormatType.JSON:
+        identity = evaluate_identity(path)
+        if identity is not None:
+            return _build_query_response(identity, FormatType.JSON, path, cursor)
+
     final_expression = wrap_expression_for_document(expression, document_index)
 
     try:
@@ -3,18 +3,20 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Annotated, Any, Literal
+from typing import TYPE_CHECKING, Annotated, Any, Literal, assert_never
 
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
 from mcp_json_yaml_toml.backends.base import FormatType, YQExecutionError
+from mcp_json_yaml_toml.backends.inprocess import evaluate_identity
 from mcp_json_yaml_toml.backends.yq import execute_yq
 from mcp_json_yaml_toml.config import require_format_enabled
 from mcp_json_yaml_toml.formats.base import (
     MultiDocumentYaml,
     _detect_file_format,
     _parse_content_for_validation,
+    _read_file_bytes,
     resolve_file_path,
     validate_document_index_for_file,
 )
@@ -24,16 +26,51 @@ from mcp_json_yaml_toml.services.schema_validation import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
     from mcp_json_yaml_toml.schemas.manager import SchemaManager
 
+# Formats _parse_content_for_validation parses, so their syntax needs no yq run
+_INPROCESS_PARSE_FORMATS = frozenset({
+    FormatType.JSON,
+    FormatType.YAML,
+    FormatType.TOML,
+})
 
 # ---------------------------------------------------------------------------
 # Schema action handlers
 # ---------------------------------------------------------------------------
 
 
+def _parse_for_validation(file_path_obj: Path, input_format: FormatType) -> Any:
+    """Parse a file for schema validation; a failed parse is a syntax error.
+
+    JSON comes from the identity cache shared with data_query and data_diff.
+    YAML and TOML are parsed in-process by the same parsers schema validation
+    has always used, so checking their syntax never spawns yq. Only formats
+    without an in-process parser are still syntax-checked by yq.
+
+    Raises:
+        ToolError: If the file cannot be parsed
+    """
+    if input_format == FormatType.JSON:
+        identity = evaluate_identity(file_path_obj)
+        if identity is not None:
+            return identity.data
+    if input_format not in _INPROCESS_PARSE_FORMATS:
+        try:
+            execute_yq(
+                ".",
+                input_file=file_path_obj,
+                input_format=input_format,
+                output_format=FormatType.JSON,
+            )
+        except YQExecutionError as e:
+            raise ToolError(str(e)) from e
+        return None
+    return _parse_content_for_validation(
+        _read_file_bytes(file_path_obj).decode("utf-8"), input_format
+    )
+
+
 def _handle_schema_validate(
     file_path: str | None,
     schema_path: str | None,
@@ -60,33 +97,26 @@ def _handle_schema_validate(
     }
 
     try:
-        execute_yq(
-            ".",
-            input_file=file_path_obj,
-            input_format=input_format,
-            output_format=FormatType.JSON,
-        )
-        validation_results["syntax_valid"] = True
-        validation_results["syntax_message"] = "Syntax is valid"
-        parsed_data = _parse_content_for_validation(
-            file_path_obj.read_text(encoding="utf-8"), input_format
-        )
-        schema_file, per_document_schema_files = _resolve_schema_targets(
-            file_path_obj, schema_path, schema_paths, schema_manager
-        )
-        validation_results.update(
-            _run_schema_validation(
-                parsed_data, schema_file, per_document_schema_files, document_index
-            )
-        )
-        schema_was_checked = bool(schema_file or per_document_schema_files)
-        validation_results["overall_valid"] = validation_results["syntax_valid"] and (
-            validation_results["schema_validated"] if schema_was_checked else True
-        )
-    except YQExecutionError as e:
+        parsed_data = _parse_for_validation(file_path_obj, input_format)
+    except (ToolError, UnicodeDecodeError) as e:
         validation_results["syntax_message"] = f"Syntax error: {e}"
         validation_results["overall_valid"] = False
+        return validation_results
+    validation_results["syntax_valid"] = True
+    validation_results["syntax_message"] = "Syntax is valid"
 
+    schema_file, per_document_schema_files = _resolve_schema_targets(
+        file_path_obj, schema_path, schema_paths, schema_manager
+    )
+    validation_results.update(
+        _run_schema_validation(
+            parsed_data, schema_file, per_document_schema_files, document_index
+        )
+    )
+    schema_was_checked = bool(schema_file or per_document_schema_files)
+    validation_results["overall_valid"] = (
+        validation_results["schema_validated"] if schema_was_checked else True
+    )
     return validation_results
 
 
@@ -203,7 +233,10 @@ def _handle_schema_scan(
     """Handle scan action."""
     if not search_paths:
         raise ToolError("search_paths required for scan action")
-    paths = [Path(p).expanduser().resolve() for p in search_paths]
+    # Roots that resolve to the same directory are scanned once, in input order
+    paths = list(
+        dict.fromkeys(resolve_file_path(p, must_exist=False) for p in search_paths)
+    )
     discovered = schema_manager.scan_for_schema_dirs(paths, max_depth=max_depth)
     return {
         "success": True,
@@ -398,17 +431,25 @@ def data_schema(
       - action="disassociate", file_path=".gitlab-ci.yml"
       - action="list"
     """
-    handlers: dict[str, Callable[[], dict[str, Any]]] = {
-        "validate": lambda: _handle_schema_validate(
-            file_path, schema_path, schema_paths, document_index, schema_manager
-        ),
-        "scan": lambda: _handle_schema_scan(search_paths, max_depth, schema_manager),
-        "add_dir": lambda: _handle_schema_add_dir(path, schema_manager),
-        "add_catalog": lambda: _handle_schema_add_catalog(name, uri, schema_manager),
-        "associate": lambda: _handle_schema_associate(
-            file_path, schema_url, schema_name, schema_manager
-        ),
-        "disassociate": lambda: _handle_schema_disassociate(file_path, schema_manager),
-        "list": lambda: _handle_schema_list(schema_manager),
-    }
-    return handlers[action]()
+    match action:
+        case "validate":
+            result = _handle_schema_validate(
+                file_path, schema_path, schema_paths, document_index, schema_manager
+            )
+        case "scan":
+            result = _handle_schema_scan(search_paths, max_depth, schema_manager)
+        case "add_dir":
+            result = _handle_schema_add_dir(path, schema_manager)
+        case "add_catalog":
+            result = _handle_schema_add_catalog(name, uri, schema_manager)
+        case "associate":
+            result = _handle_schema_associate(
+                file_path, schema_url, schema_name, schema_manager
+            )
+        case "disassociate":
+            result = _handle_schema_disassociate(file_path, schema_manager)
+        case "list":
+            result = _handle_schema_list(schema_manager)
+        case _:
+            assert_never(action)
+    return result